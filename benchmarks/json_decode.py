@@ -0,0 +1,36 @@
+"""Benchmark decoding of receiver responses from the test fixtures."""
+import json
+import os
+import timeit
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+NUMBER = 50000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    decoders = {
+        "json.loads(str)": lambda content: json.loads(content.decode("utf8")),
+        "json.loads(bytes)": json.loads,
+    }
+
+    if orjson is not None:
+        decoders["orjson.loads(bytes)"] = orjson.loads
+
+    for fixture in ("tv-get-tuned.json", "info-mode.json", "info-get-locations.json"):
+        with open(os.path.join(FIXTURES, fixture), "rb") as fptr:
+            content = fptr.read()
+
+        print(fixture)
+        for name, decoder in decoders.items():
+            seconds = timeit.timeit(lambda: decoder(content), number=NUMBER)
+            print(f"  {name:>20}: {seconds / NUMBER * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark the memory held by the latest state of many clients."""
+import json
+import os
+import tracemalloc
+from typing import Any, Callable
+
+from directv.compact import CompactProgram, CompactState
+from directv.models import Program, State
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+CLIENTS = 10000
+
+
+def measure(factory: Callable[[dict], Any], payloads: list) -> float:
+    """Return the bytes allocated per client by a state factory."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    states = [factory(payload) for payload in payloads]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del states
+    return allocated / len(payloads)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with open(os.path.join(FIXTURES, "tv-get-tuned.json"), "rb") as fptr:
+        template = json.loads(fptr.read())
+
+    payloads = [
+        {**template, "offset": client, "uniqueId": str(client)}
+        for client in range(CLIENTS)
+    ]
+
+    factories = {
+        "State(Program)": lambda data: State(
+            authorized=True,
+            available=True,
+            standby=False,
+            program=Program.from_dict(data),
+        ),
+        "CompactState(CompactProgram)": lambda data: CompactState(
+            authorized=True,
+            available=True,
+            standby=False,
+            program=CompactProgram.from_dict(data),
+        ),
+    }
+
+    print(f"{CLIENTS} clients")
+    for name, factory in factories.items():
+        print(f"  {name:>30}: {measure(factory, payloads):.0f} bytes/client")
+
+
+if __name__ == "__main__":
+    main()
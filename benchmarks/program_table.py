@@ -0,0 +1,35 @@
+"""Benchmark parsing many tuned programs into objects or a table."""
+import json
+import os
+import timeit
+
+from directv.models import Program
+from directv.table import ProgramTable
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+ROWS = 10000
+NUMBER = 10
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with open(os.path.join(FIXTURES, "tv-get-tuned.json"), "rb") as fptr:
+        template = json.loads(fptr.read())
+
+    payloads = [{**template, "major": 200 + row % 50} for row in range(ROWS)]
+
+    def objects() -> int:
+        programs = [Program.from_dict(data) for data in payloads]
+        return sum(1 for program in programs if program.channel == "206")
+
+    def table() -> int:
+        return len(ProgramTable.from_dicts(payloads).where_channel("206"))
+
+    print(f"{ROWS} programs")
+    for name, run in (("Program.from_dict", objects), ("ProgramTable", table)):
+        seconds = timeit.timeit(run, number=NUMBER)
+        print(f"  {name:>20}: {seconds / NUMBER * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
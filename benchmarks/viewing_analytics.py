@@ -0,0 +1,42 @@
+"""Benchmark viewing analytics over a large recorded state history."""
+import json
+import os
+import timeit
+
+from directv.analytics import ViewingStats
+from directv.history import StateHistory
+from directv.models import Program, State
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+CLIENTS = 100
+SAMPLES = 10000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with open(os.path.join(FIXTURES, "tv-get-tuned.json"), "rb") as fptr:
+        template = json.loads(fptr.read())
+
+    states = [
+        State(
+            authorized=True,
+            available=True,
+            standby=False,
+            program=Program.from_dict({**template, "major": 200 + channel}),
+        )
+        for channel in range(10)
+    ]
+    standby = State(authorized=True, available=True, standby=True, program=None)
+
+    history = StateHistory(capacity=SAMPLES)
+    for client in range(CLIENTS):
+        for sample in range(SAMPLES):
+            state = standby if sample % 7 == 0 else states[(sample // 50) % 10]
+            history.record(str(client), state, sample * 5.0)
+
+    seconds = timeit.timeit(lambda: ViewingStats.from_history(history), number=1)
+    print(f"{CLIENTS * SAMPLES} samples: {seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,3 +5,4 @@ from .directv import (  # noqa
     DIRECTVConnectionError,
     DIRECTVError,
 )
+from .fleet import DIRECTVFleet  # noqa
@@ -0,0 +1,99 @@
+"""Viewing analytics over the state history of DirecTV receiver clients."""
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Mapping, Optional
+
+from .history import HistoryWindow, StateHistory
+from .utils import combine_channel_number
+
+
+@dataclass(frozen=True)
+class ViewingStats:
+    """Object holding viewing aggregates of many receiver clients."""
+
+    channel_minutes: Dict[str, float]
+    client_minutes: Dict[Hashable, float]
+    hour_minutes: Dict[int, float]
+    standby_ratios: Dict[Hashable, float]
+    switch_rates: Dict[Hashable, float]
+
+    @staticmethod
+    def from_windows(
+        windows: Mapping[Hashable, HistoryWindow], max_gap: float = 300
+    ) -> "ViewingStats":
+        """Return ViewingStats object from sample windows keyed by client.
+
+        Each sample counts until the next sample of its client, unless
+        they are more than ``max_gap`` seconds apart. Hours are keyed by
+        the epoch second the hour starts at.
+        """
+        channels: Dict[tuple, float] = defaultdict(float)
+        hours: Dict[int, float] = defaultdict(float)
+        client_minutes = {}
+        standby_ratios = {}
+        switch_rates = {}
+
+        for client, window in windows.items():
+            at = window.at
+            watched = standby_time = 0.0
+            switches = 0
+            previous = None
+
+            for started, ended, standby, major, minor in zip(
+                at, at[1:], window.standby, window.major, window.minor
+            ):
+                elapsed = ended - started
+                if elapsed > max_gap:
+                    previous = None
+                    continue
+
+                if standby:
+                    standby_time += elapsed
+                    previous = None
+                    continue
+
+                channel = (major, minor)
+                if previous is not None and previous != channel:
+                    switches += 1
+                previous = channel
+
+                watched += elapsed
+                channels[channel] += elapsed
+                hours[int(started // 3600) * 3600] += elapsed
+
+            total = watched + standby_time
+            client_minutes[client] = watched / 60
+            standby_ratios[client] = standby_time / total if total else 0.0
+            switch_rates[client] = switches / (watched / 3600) if watched else 0.0
+
+        return ViewingStats(
+            channel_minutes={
+                combine_channel_number(major, minor): seconds / 60
+                for (major, minor), seconds in channels.items()
+            },
+            client_minutes=client_minutes,
+            hour_minutes={hour: seconds / 60 for hour, seconds in hours.items()},
+            standby_ratios=standby_ratios,
+            switch_rates=switch_rates,
+        )
+
+    @staticmethod
+    def from_history(
+        history: StateHistory,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        max_gap: float = 300,
+    ) -> "ViewingStats":
+        """Return ViewingStats object from the state history of clients."""
+        if start is None and end is None:
+            windows = {client: history[client].latest() for client in history}
+        else:
+            windows = {
+                client: history[client].between(
+                    float("-inf") if start is None else start,
+                    float("inf") if end is None else end,
+                )
+                for client in history
+            }
+
+        return ViewingStats.from_windows(windows, max_gap)
@@ -0,0 +1,43 @@
+"""Circuit breaker for DirecTV."""
+from time import monotonic
+from typing import Optional
+
+
+class CircuitBreaker:
+    """Circuit breaker for a receiver that stopped responding.
+
+    The circuit opens after ``failure_threshold`` consecutive connection
+    failures. Requests then fail fast until ``reset_timeout`` seconds have
+    passed, after which the circuit is half-open and a single probe
+    decides whether it closes again.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30) -> None:
+        """Initialize a closed circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """Return the state of the circuit: closed, open or half-open."""
+        if self._opened_at is None:
+            return "closed"
+
+        if monotonic() - self._opened_at < self.reset_timeout:
+            return "open"
+
+        return "half-open"
+
+    def record_success(self) -> None:
+        """Close the circuit after the receiver responded."""
+        self.failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a connection failure and open the circuit when tripped."""
+        self.failures += 1
+
+        if self.failures >= self.failure_threshold:
+            self._opened_at = monotonic()
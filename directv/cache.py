@@ -0,0 +1,122 @@
+"""Response cache for DirecTV."""
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+from .const import CACHE_TTLS
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+def request_key(uri: str, params: Optional[Mapping[str, Any]]) -> CacheKey:
+    """Return the key identifying a request to an endpoint."""
+    if not params:
+        return (uri.strip("/"), ())
+
+    return (uri.strip("/"), tuple(sorted(params.items())))
+
+
+class ResponseCache:
+    """LRU cache of receiver responses with a time to live per endpoint.
+
+    Only endpoints listed in ``ttls`` are cached. Cached responses are
+    shared between callers and must not be mutated. Responses are kept
+    apart per ``receiver``, so one cache can be shared by many receivers.
+    Every invalidation bumps a generation, so reads started before it can
+    be told apart.
+    """
+
+    def __init__(
+        self, ttls: Optional[Mapping[str, float]] = None, max_size: int = 256
+    ) -> None:
+        """Initialize an empty response cache."""
+        self.ttls = dict(CACHE_TTLS if ttls is None else ttls)
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[Hashable, CacheKey], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._generation = 0
+        self._generations: Dict[Tuple[Hashable, Optional[str]], int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def generation(
+        self, client: Optional[str] = None, receiver: Hashable = None
+    ) -> Tuple[int, int, int, int]:
+        """Return the invalidation generation of a client of a receiver."""
+        generations = self._generations
+
+        return (
+            self._generation,
+            generations.get((receiver, None), 0),
+            generations.get((receiver, client), 0) if client else 0,
+            generations.get((None, client), 0) if client else 0,
+        )
+
+    def get(
+        self,
+        uri: str,
+        params: Optional[Mapping[str, Any]] = None,
+        receiver: Hashable = None,
+    ) -> Any:
+        """Return a cached response or None when missing or expired."""
+        key = (receiver, request_key(uri, params))
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        expires, value = entry
+        if expires <= monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        uri: str,
+        params: Optional[Mapping[str, Any]],
+        value: Any,
+        receiver: Hashable = None,
+    ) -> None:
+        """Store a response when its endpoint is cacheable."""
+        ttl = self.ttls.get(uri.strip("/"))
+        if not ttl or value is None:
+            return
+
+        key = (receiver, request_key(uri, params))
+        self._entries[key] = (monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(
+        self, client: Optional[str] = None, receiver: Hashable = None
+    ) -> None:
+        """Drop cached responses of a client of a receiver, or all responses.
+
+        Without a client all responses of the receiver are dropped, and
+        without a receiver the responses of the client on every receiver.
+        """
+        if client is None and receiver is None:
+            self._generation += 1
+            self._entries.clear()
+            return
+
+        generation = (receiver, client)
+        self._generations[generation] = self._generations.get(generation, 0) + 1
+
+        stale = [
+            key
+            for key in self._entries
+            if receiver is None or key[0] == receiver
+            if client is None or ("clientAddr", client) in key[1][1]
+        ]
+
+        for key in stale:
+            del self._entries[key]
@@ -0,0 +1,96 @@
+"""Compact tuple-backed models for DirecTV."""
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from .models import (
+    State,
+    _info_fields,
+    _location_fields,
+    _program_fields,
+)
+
+
+class CompactInfo(NamedTuple):
+    """Tuple holding information from DirecTV."""
+
+    brand: str
+    receiver_id: str
+    version: str
+
+    @staticmethod
+    def from_dict(data: dict) -> "CompactInfo":
+        """Return CompactInfo object from DirecTV API response."""
+        return CompactInfo(**_info_fields(data))
+
+
+class CompactLocation(NamedTuple):
+    """Tuple holding all information of receiver client location."""
+
+    client: bool
+    name: str
+    address: str
+
+    @staticmethod
+    def from_dict(data: dict) -> "CompactLocation":
+        """Return CompactLocation object from DirecTV API response."""
+        return CompactLocation(**_location_fields(data))
+
+
+class CompactProgram(NamedTuple):
+    """Tuple holding all information of playing program."""
+
+    channel: str
+    channel_name: str
+    ondemand: bool
+    recorded: bool
+    recording: bool
+    viewed: bool
+    program_id: int
+    program_type: str
+    duration: int
+    title: str
+    episode_title: str
+    music_title: str
+    music_album: str
+    music_artist: str
+    partial: bool
+    payperview: bool
+    position: int
+    purchased: bool
+    rating: str
+    start_time: datetime
+    unique_id: int
+
+    def with_position(self, position: int) -> "CompactProgram":
+        """Return a copy of the program at another position."""
+        return self._replace(position=position)
+
+    @staticmethod
+    def from_dict(data: dict) -> "CompactProgram":
+        """Return CompactProgram object from DirecTV API response."""
+        return CompactProgram(**_program_fields(data))
+
+
+class CompactState(NamedTuple):
+    """Tuple holding all information of a single receiver client state."""
+
+    authorized: bool
+    available: bool
+    standby: bool
+    program: Optional[CompactProgram]
+    at: datetime = State.at
+
+    @staticmethod
+    def from_state(state: State) -> "CompactState":
+        """Return CompactState object from a receiver client state."""
+        program = None
+        if state.program is not None:
+            program = CompactProgram(**state.program.__dict__)
+
+        return CompactState(
+            authorized=state.authorized,
+            available=state.available,
+            standby=state.standby,
+            program=program,
+            at=state.at,
+        )
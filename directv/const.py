@@ -45,3 +45,32 @@ VALID_REMOTE_KEYS = [
     "dash",
     "enter",
 ]
+
+READ_ENDPOINTS = [
+    "info/getLocations",
+    "info/getOptions",
+    "info/getVersion",
+    "info/mode",
+    "tv/getProgInfo",
+    "tv/getTuned",
+]
+
+CACHE_TTLS = {
+    "info/getVersion": 3 * 60 * 60,
+    "info/getLocations": 3 * 60 * 60,
+    "info/mode": 2,
+    "tv/getTuned": 2,
+}
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+VALID_REMOTE_HOLDS = ["keyPress", "keyDown", "keyUp"]
+
+REMOTE_MACROS = {
+    "dismiss": ["exit", "exit", "exit"],
+    "sleep": ["poweroff"],
+    "wake": ["poweron", "exit"],
+}
+
+KEEPALIVE_TIMEOUT = 15
@@ -1,18 +1,90 @@
 """Asynchronous Python client for DirecTV."""
 import asyncio
 import json
+from contextvars import ContextVar
 from socket import gaierror as SocketGIAEroor
-from typing import Any, Mapping, Optional
+from time import monotonic
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import aiohttp
 import async_timeout
 from yarl import URL
 
 from .__version__ import __version__
-from .const import VALID_REMOTE_KEYS
-from .exceptions import DIRECTVAccessRestricted, DIRECTVConnectionError, DIRECTVError
-from .models import Device, Program, State
-from .utils import parse_channel_number
+from .breaker import CircuitBreaker
+from .cache import ResponseCache, request_key
+from .const import (
+    KEEPALIVE_TIMEOUT,
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    READ_ENDPOINTS,
+    REMOTE_MACROS,
+    VALID_REMOTE_HOLDS,
+    VALID_REMOTE_KEYS,
+)
+from .exceptions import (  # noqa: F401
+    DIRECTVAccessRestricted,
+    DIRECTVConnectionError,
+    DIRECTVError,
+)
+from .history import StateHistory
+from .models import (
+    Device,
+    Program,
+    RequestResult,
+    State,
+    StateChange,
+    TuneConfirmation,
+)
+from .pool import ProgramPool
+from .queue import RequestQueue
+from .scheduler import PollScheduler
+from .session import SESSION_MANAGER, SessionManager
+from .stats import LatencyStats, RequestMetrics
+from .utils import combine_channel_number, parse_channel_number
+from .watcher import StateWatcher
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON response body with the standard library."""
+    return json.loads(content.decode("utf8"))
+
+
+def _is_json(content_type: Optional[str], content: bytes) -> bool:
+    """Return if a response body is JSON, whatever its declared content type."""
+    if content_type and "json" in content_type:
+        return True
+
+    return content.lstrip()[:1] in (b"{", b"[")
+
+
+_WARMING: "ContextVar[bool]" = ContextVar("directv_warming", default=False)
+
+
+def _discard(task: asyncio.Future) -> None:
+    """Cancel a pending task or silence the outcome of a finished one."""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
 
 
 class DIRECTV:
@@ -30,21 +102,164 @@ class DIRECTV:
         session: aiohttp.client.ClientSession = None,
         username: str = None,
         user_agent: str = None,
+        speculative_state: bool = False,
+        cache: ResponseCache = None,
+        circuit_breaker: CircuitBreaker = None,
+        request_queue: RequestQueue = None,
+        session_manager: SessionManager = None,
+        keep_warm: Optional[float] = None,
+        keepalive_timeout: Optional[float] = None,
+        instrumentation: Callable[[RequestMetrics], Any] = None,
+        json_loads: Callable[[bytes], Any] = None,
+        program_pool: ProgramPool = None,
+        history: StateHistory = None,
     ) -> None:
         """Initialize connection with receiver."""
         self._session = session
+        self._session_manager = session_manager or SESSION_MANAGER
         self._close_session = False
+        self._cache = cache
+        self._circuit_breaker = circuit_breaker
+        self._request_queue = request_queue
+        self._instrumentation = instrumentation
+        self._program_pool = program_pool
+        self._history = history
+        self._json_loads = json_loads or (orjson.loads if orjson else _json_loads)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._watchers: Dict[str, StateWatcher] = {}
+        self._programs: Dict[str, Tuple[Tuple[Any, ...], Program]] = {}
+        self._warm_task: Optional[asyncio.Future] = None
+        self._last_response: Optional[float] = None
+        self._latency = {"warm": LatencyStats(), "cold": LatencyStats()}
+
+        self._base_path = base_path
+        self._host = host
+        self._password = password
+        self._port = port
+        self._username = username
+        self._user_agent = user_agent
 
-        self.base_path = base_path
-        self.host = host
-        self.password = password
-        self.port = port
+        if user_agent is None:
+            self._user_agent = f"PythonDirecTV/{__version__}"
+
+        self.keep_warm = keep_warm
+        self.keepalive_timeout = keepalive_timeout
         self.request_timeout = request_timeout
-        self.username = username
-        self.user_agent = user_agent
+        self.speculative_state = speculative_state
 
-        if user_agent is None:
-            self.user_agent = f"PythonDirecTV/{__version__}"
+        self._reset_request_cache()
+
+    @property
+    def keep_warm(self) -> Optional[float]:
+        """Return the seconds of idle time after which the receiver is pinged."""
+        return self._warm_interval
+
+    @keep_warm.setter
+    def keep_warm(self, value: Optional[float]) -> None:
+        """Set the seconds of idle time after which the receiver is pinged."""
+        self._warm_interval = value
+
+        if not value and self._warm_task is not None:
+            self._warm_task.cancel()
+            self._warm_task = None
+
+    @property
+    def base_path(self) -> str:
+        """Return the base path of the receiver API."""
+        return self._base_path
+
+    @base_path.setter
+    def base_path(self, value: str) -> None:
+        """Set the base path of the receiver API."""
+        self._base_path = value
+        self._reset_request_cache()
+
+    @property
+    def host(self) -> str:
+        """Return the host of the receiver."""
+        return self._host
+
+    @host.setter
+    def host(self, value: str) -> None:
+        """Set the host of the receiver."""
+        self._host = value
+        self._reset_request_cache()
+
+    @property
+    def password(self) -> Optional[str]:
+        """Return the password used to authenticate with the receiver."""
+        return self._password
+
+    @password.setter
+    def password(self, value: Optional[str]) -> None:
+        """Set the password used to authenticate with the receiver."""
+        self._password = value
+        self._reset_request_cache()
+
+    @property
+    def port(self) -> int:
+        """Return the port of the receiver API."""
+        return self._port
+
+    @port.setter
+    def port(self, value: int) -> None:
+        """Set the port of the receiver API."""
+        self._port = value
+        self._reset_request_cache()
+
+    @property
+    def username(self) -> Optional[str]:
+        """Return the username used to authenticate with the receiver."""
+        return self._username
+
+    @username.setter
+    def username(self, value: Optional[str]) -> None:
+        """Set the username used to authenticate with the receiver."""
+        self._username = value
+        self._reset_request_cache()
+
+    @property
+    def user_agent(self) -> str:
+        """Return the user agent sent to the receiver."""
+        return self._user_agent
+
+    @user_agent.setter
+    def user_agent(self, value: str) -> None:
+        """Set the user agent sent to the receiver."""
+        self._user_agent = value
+        self._reset_request_cache()
+
+    def _reset_request_cache(self) -> None:
+        """Rebuild the request plumbing derived from the connection settings."""
+        self._receiver = (self._host, self._port)
+        self._base_url: Optional[URL] = None
+        self._urls: Dict[str, URL] = {}
+
+        self._auth = None
+        if self._username and self._password:
+            self._auth = aiohttp.BasicAuth(self._username, self._password)
+
+        self._headers = {
+            "User-Agent": self._user_agent,
+            "Accept": "application/json, text/plain, */*",
+        }
+
+    def _url(self, uri: str) -> URL:
+        """Return the cached URL of an endpoint on the receiver."""
+        url = self._urls.get(uri)
+
+        if url is None:
+            if self._base_url is None:
+                self._base_url = URL.build(
+                    scheme="http",
+                    host=self._host,
+                    port=self._port,
+                    path=self._base_path,
+                )
+
+            url = self._urls[uri] = self._base_url.join(URL(uri))
+
+        return url
 
     async def _request(
         self,
@@ -54,70 +269,312 @@ class DIRECTV:
         params: Optional[Mapping[str, str]] = None,
     ) -> Any:
         """Handle a request to a receiver."""
-        scheme = "http"
+        result = await self._request_result(uri, method, data, params)
+        return result.unwrap()
+
+    async def _request_result(
+        self,
+        uri: str = "",
+        method: str = "GET",
+        data: Optional[Any] = None,
+        params: Optional[Mapping[str, str]] = None,
+    ) -> RequestResult:
+        """Handle a request to a receiver without raising on failures.
 
-        url = URL.build(
-            scheme=scheme, host=self.host, port=self.port, path=self.base_path
-        ).join(URL(uri))
+        Reads are served from the cache when possible and identical
+        concurrent reads share a single request to the receiver.
+        """
+        if method != "GET" or uri.strip("/") not in READ_ENDPOINTS:
+            return await self._fetch(uri, method, data, params)
 
-        auth = None
-        if self.username and self.password:
-            auth = aiohttp.BasicAuth(self.username, self.password)
+        if self._cache is not None:
+            response = self._cache.get(uri, params, self._receiver)
+            if response is not None:
+                return RequestResult(200, response)
 
-        headers = {
-            "User-Agent": self.user_agent,
-            "Accept": "application/json, text/plain, */*",
-        }
+        return await self._coalesce(
+            request_key(uri, params), lambda: self._read(uri, data, params)
+        )
+
+    async def _read(
+        self, uri: str, data: Optional[Any], params: Optional[Mapping[str, str]],
+    ) -> RequestResult:
+        """Send a read request to a receiver and cache its response.
+
+        Responses are not cached when the client was invalidated while
+        the request was in flight.
+        """
+        cache = self._cache
+        if cache is None:
+            return await self._fetch(uri, "GET", data, params)
+
+        receiver = self._receiver
+        client = params.get("clientAddr") if params else None
+        generation = cache.generation(client, receiver)
+
+        result = await self._fetch(uri, "GET", data, params)
 
+        if result.ok and cache.generation(client, receiver) == generation:
+            cache.set(uri, params, result.data, receiver)
+
+        return result
+
+    async def _coalesce(
+        self, key: Hashable, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Share one in-flight call between identical concurrent callers."""
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            task.add_done_callback(_discard)
+
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        uri: str,
+        method: str,
+        data: Optional[Any],
+        params: Optional[Mapping[str, str]],
+    ) -> RequestResult:
+        """Send a request to a receiver guarded by the circuit breaker."""
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return await self._dispatch(uri, method, data, params)
+
+        state = breaker.state
+        if state == "open":
+            return RequestResult(
+                None,
+                error={},
+                message="Receiver is not responding, "
+                "skipping request until it recovers",
+            )
+
+        if state == "half-open":
+            probe = await self._coalesce("probe", self._probe)
+            if not probe.reachable:
+                return probe
+
+        result = await self._dispatch(uri, method, data, params)
+
+        if result.reachable:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+        return result
+
+    async def _dispatch(
+        self,
+        uri: str,
+        method: str,
+        data: Optional[Any],
+        params: Optional[Mapping[str, str]],
+    ) -> RequestResult:
+        """Send a request to a receiver in turn of the request queue.
+
+        Reads are sent with background priority, commands jump ahead.
+        """
+        if self._request_queue is None:
+            return await self._send(uri, method, data, params)
+
+        priority = PRIORITY_INTERACTIVE
+        if uri.strip("/") in READ_ENDPOINTS:
+            priority = PRIORITY_BACKGROUND
+
+        return await self._request_queue.run(
+            lambda: self._send(uri, method, data, params), priority
+        )
+
+    async def _probe(self) -> RequestResult:
+        """Probe a receiver behind an open circuit with a cheap request."""
+        breaker = self._circuit_breaker
+        assert breaker is not None
+
+        result = await self._send("info/getVersion", "GET", None, None)
+
+        if result.reachable:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+        return result
+
+    async def _send(
+        self,
+        uri: str,
+        method: str,
+        data: Optional[Any],
+        params: Optional[Mapping[str, str]],
+    ) -> RequestResult:
+        """Send a request to a receiver."""
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = self._session_manager.acquire()
             self._close_session = True
 
+        if self._warm_task is None and self._ping_interval():
+            self._warm_task = asyncio.ensure_future(self._keep_warm())
+
+        started = monotonic()
+        warm = False
+        if self._last_response is not None:
+            warm = started - self._last_response < self._keepalive()
+
+        size = 0
+        error: Optional[str] = None
+
         try:
             with async_timeout.timeout(self.request_timeout):
                 response = await self._session.request(
-                    method, url, auth=auth, data=data, params=params, headers=headers,
+                    method,
+                    self._url(uri),
+                    auth=self._auth,
+                    data=data,
+                    params=params,
+                    headers=self._headers,
                 )
         except asyncio.TimeoutError as exception:
-            raise DIRECTVConnectionError(
-                "Timeout occurred while connecting to receiver"
-            ) from exception
+            error = "timeout"
+            result = RequestResult(
+                None,
+                error={},
+                message="Timeout occurred while connecting to receiver",
+                cause=exception,
+            )
         except (aiohttp.ClientError, SocketGIAEroor) as exception:
-            raise DIRECTVConnectionError(
-                "Error occurred while communicating with receiver"
-            ) from exception
+            error = "connection"
+            result = RequestResult(
+                None,
+                error={},
+                message="Error occurred while communicating with receiver",
+                cause=exception,
+            )
+        else:
+            self._last_response = monotonic()
+            if not _WARMING.get():
+                self._latency["warm" if warm else "cold"].record(
+                    self._last_response - started
+                )
 
-        if response.status == 403:
-            raise DIRECTVAccessRestricted(
-                "Access restricted. Please ensure external device access is allowed",
-                {},
+            if response.status == 403:
+                result = RequestResult(
+                    403,
+                    error={},
+                    message="Access restricted. "
+                    "Please ensure external device access is allowed",
+                )
+            else:
+                content = await response.read()
+                size = len(content)
+                result = self._parse(response, content)
+
+        if self._instrumentation is not None:
+            self._instrumentation(
+                RequestMetrics(
+                    host=self._host,
+                    endpoint=uri.strip("/"),
+                    status=result.status,
+                    latency=monotonic() - started,
+                    size=size,
+                    error=error,
+                    warm=warm,
+                )
             )
 
+        return result
+
+    def _parse(
+        self, response: aiohttp.ClientResponse, content: bytes
+    ) -> RequestResult:
+        """Parse the body of a response from a receiver."""
+        status = response.status
         content_type = response.headers.get("Content-Type")
 
-        if (response.status // 100) in [4, 5]:
-            content = await response.read()
+        if (status // 100) in [4, 5]:
             response.close()
 
-            if content_type == "application/json":
-                raise DIRECTVError(
-                    f"HTTP {response.status}", json.loads(content.decode("utf8"))
-                )
+            payload = None
+            if _is_json(content_type, content):
+                try:
+                    payload = self._json_loads(content)
+                except ValueError:
+                    pass
 
-            raise DIRECTVError(
-                f"HTTP {response.status}",
-                {
+            if payload is None:
+                payload = {
                     "content-type": content_type,
                     "message": content.decode("utf8"),
-                    "status-code": response.status,
-                },
-            )
+                    "status-code": status,
+                }
+
+            return RequestResult(status, error=payload, message=f"HTTP {status}")
+
+        if content_type and "application/json" in content_type:
+            if not content.strip():
+                return RequestResult(status, None)
+
+            try:
+                return RequestResult(status, self._json_loads(content))
+            except ValueError as exception:
+                return RequestResult(
+                    status,
+                    error={
+                        "content-type": content_type,
+                        "message": content.decode("utf8", "replace"),
+                        "status-code": status,
+                    },
+                    message="Receiver returned an invalid JSON response",
+                    cause=exception,
+                )
+
+        if _is_json(content_type, content):
+            try:
+                return RequestResult(status, self._json_loads(content))
+            except ValueError:
+                pass
+
+        return RequestResult(status, content.decode(response.get_encoding()))
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """Return the response cache, if any."""
+        return self._cache
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Return the circuit breaker, if any."""
+        return self._circuit_breaker
 
-        if "application/json" in content_type:
-            data = await response.json()
-            return data
+    @property
+    def history(self) -> Optional[StateHistory]:
+        """Return the state history, if any."""
+        return self._history
+
+    @property
+    def instrumentation(self) -> Optional[Callable[[RequestMetrics], Any]]:
+        """Return the instrumentation hook, if any."""
+        return self._instrumentation
+
+    @property
+    def program_pool(self) -> Optional[ProgramPool]:
+        """Return the program interning pool, if any."""
+        return self._program_pool
+
+    @property
+    def request_queue(self) -> Optional[RequestQueue]:
+        """Return the request queue, if any."""
+        return self._request_queue
 
-        return await response.text()
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return request statistics of the receiver."""
+        return {
+            "latency": {name: stats.as_dict() for name, stats in self._latency.items()}
+        }
 
     @property
     def device(self) -> Optional[Device]:
@@ -127,18 +584,22 @@ class DIRECTV:
     async def update(self, full_update: bool = False) -> Device:
         """Get all information about the device in a single call."""
         if self._device is None or full_update:
-            info = await self._request("info/getVersion")
-            if info is None:
-                raise DIRECTVError("DirecTV device returned an empty API response")
+            return await self._coalesce("update", self._update)
 
-            locations = await self._request("info/getLocations")
-            if locations is None or "locations" not in locations:
-                raise DIRECTVError("DirecTV device returned an empty API response")
+        self._device.update_from_dict({})
+        return self._device
 
-            self._device = Device({"info": info, "locations": locations["locations"]})
-            return self._device
+    async def _update(self) -> Device:
+        """Fetch all information about the device."""
+        info = await self._request("info/getVersion")
+        if info is None:
+            raise DIRECTVError("DirecTV device returned an empty API response")
 
-        self._device.update_from_dict({})
+        locations = await self._request("info/getLocations")
+        if locations is None or "locations" not in locations:
+            raise DIRECTVError("DirecTV device returned an empty API response")
+
+        self._device = Device({"info": info, "locations": locations["locations"]})
         return self._device
 
     async def remote(self, key: str, client: str = "0") -> None:
@@ -151,82 +612,337 @@ class DIRECTV:
         blue, chanup, chandown, prev, 0, 1, 2, 3, 4, 5,
         6, 7, 8, 9, dash, enter
         """
-        if not key.lower() in VALID_REMOTE_KEYS:
-            raise DIRECTVError(f"Remote key is invalid: {key}")
+        await self.remote_sequence([key], client)
 
-        keypress = {
-            "key": key,
-            "hold": "keyPress",
-            "clientAddr": client,
-        }
+    async def remote_sequence(
+        self,
+        keys: Iterable[Union[str, Tuple[str, str]]],
+        client: str = "0",
+        pacing: float = 0,
+        hold: str = "keyPress",
+    ) -> None:
+        """Emulate pressing a sequence of keys on the remote.
+
+        Keys are sent in order, ``pacing`` seconds apart. A key may be
+        given as a ``(key, hold)`` tuple to send keyDown or keyUp instead
+        of the default hold of the sequence.
+        """
+        keypresses = []
+
+        for item in keys:
+            key, key_hold = (item, hold) if isinstance(item, str) else item
+
+            if not key.lower() in VALID_REMOTE_KEYS:
+                raise DIRECTVError(f"Remote key is invalid: {key}")
+
+            if key_hold not in VALID_REMOTE_HOLDS:
+                raise DIRECTVError(f"Remote hold is invalid: {key_hold}")
+
+            keypresses.append({"key": key, "hold": key_hold, "clientAddr": client})
+
+        try:
+            for index, keypress in enumerate(keypresses):
+                if index and pacing:
+                    await asyncio.sleep(pacing)
+
+                await self._request("remote/processKey", params=keypress)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(client, self._receiver)
+
+    async def remote_macro(
+        self,
+        macro: Union[str, Sequence[str]],
+        clients: Iterable[str] = ("0",),
+        pacing: float = 0,
+    ) -> None:
+        """Run a sequence of keys on several receiver clients at once.
+
+        Macros can be given by name, see REMOTE_MACROS, or as a list of keys.
+        """
+        if isinstance(macro, str):
+            if macro not in REMOTE_MACROS:
+                raise DIRECTVError(f"Remote macro is invalid: {macro}")
+            macro = REMOTE_MACROS[macro]
 
-        await self._request("remote/processKey", params=keypress)
+        await asyncio.gather(
+            *(self.remote_sequence(macro, client, pacing) for client in clients)
+        )
 
     async def state(self, client: str = "0") -> State:
-        """Get state of receiver client."""
+        """Get state of receiver client.
+
+        When speculative state is enabled, the tuned program is requested
+        alongside the mode and discarded when the client is in standby.
+        """
         authorized = True
         program = None
+        params = {"clientAddr": client}
+        tuned = None
+
+        if self.speculative_state:
+            tuned = asyncio.ensure_future(
+                self._request_result("tv/getTuned", params=params)
+            )
 
         try:
-            mode = await self._request("info/mode", params={"clientAddr": client})
-            available = True
-            standby = mode["mode"] == 1
-        except DIRECTVAccessRestricted:
-            authorized = False
-            available = False
-            standby = True
-        except DIRECTVError:
-            available = False
-            standby = True
-
-        if not standby:
-            try:
-                program = await self.tuned(client)
-            except DIRECTVAccessRestricted:
-                authorized = False
-                program = None
-            except DIRECTVError:
+            mode = await self._request_result("info/mode", params=params)
+
+            if mode.ok:
+                available = True
+                standby = mode.data["mode"] == 1
+            else:
+                authorized = not mode.restricted
                 available = False
-                program = None
+                standby = True
 
-        return State(
+            if not standby:
+                result = await (
+                    tuned or self._request_result("tv/getTuned", params=params)
+                )
+
+                if result.ok:
+                    program = self._program(client, result.data)
+                elif result.restricted:
+                    authorized = False
+                else:
+                    available = False
+        finally:
+            if tuned is not None:
+                _discard(tuned)
+
+        state = State(
             authorized=authorized,
             available=available,
             standby=standby,
             program=program,
         )
 
+        if self._history is not None:
+            self._history.record((self._host, client), state)
+
+        return state
+
+    async def states(self) -> Dict[str, State]:
+        """Get state of all receiver client locations."""
+        device = await self.update()
+        addresses = [location.address for location in device.locations]
+
+        states = await asyncio.gather(*(self.state(address) for address in addresses))
+        return dict(zip(addresses, states))
+
     async def status(self, client: str = "0") -> str:
         """Get basic status of receiver client."""
-        try:
-            mode = await self._request("info/mode", params={"clientAddr": client})
-            return "standby" if mode["mode"] == 1 else "active"
-        except DIRECTVAccessRestricted:
-            return "unauthorized"
-        except DIRECTVError:
-            return "unavailable"
-
-    async def tune(self, channel: str, client: str = "0") -> None:
-        """Change the channel on the receiver."""
+        mode = await self._request_result("info/mode", params={"clientAddr": client})
+
+        if mode.ok:
+            return "standby" if mode.data["mode"] == 1 else "active"
+
+        return "unauthorized" if mode.restricted else "unavailable"
+
+    async def tune(
+        self,
+        channel: str,
+        client: str = "0",
+        confirm: bool = False,
+        confirm_timeout: float = 5,
+        confirm_interval: float = 0.25,
+    ) -> Optional[TuneConfirmation]:
+        """Change the channel on the receiver.
+
+        With confirm, the tuned program is polled every ``confirm_interval``
+        seconds until it is on the requested channel, for at most
+        ``confirm_timeout`` seconds.
+        """
         major, minor = parse_channel_number(channel)
 
+        expected = None
+        if confirm:
+            try:
+                expected = combine_channel_number(int(major), int(minor))
+            except ValueError as exception:
+                raise DIRECTVError(f"Channel is invalid: {channel}") from exception
+
         tune = {
             "major": major,
             "minor": minor,
             "clientAddr": client,
         }
 
-        await self._request("tv/tune", params=tune)
+        started = monotonic()
+
+        try:
+            await self._request("tv/tune", params=tune)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(client, self._receiver)
+
+        if not confirm:
+            return None
+
+        try:
+            with async_timeout.timeout(confirm_timeout):
+                while True:
+                    if self._cache is not None:
+                        self._cache.invalidate(client, self._receiver)
+
+                    try:
+                        program = await self.tuned(client)
+                    except DIRECTVAccessRestricted:
+                        raise
+                    except DIRECTVError:
+                        program = None
+
+                    if program is not None and program.channel == expected:
+                        return TuneConfirmation(
+                            program=program, elapsed=monotonic() - started
+                        )
+
+                    await asyncio.sleep(confirm_interval)
+        except asyncio.TimeoutError as exception:
+            raise DIRECTVError(
+                f"Receiver did not confirm tuning to channel {channel}"
+            ) from exception
 
     async def tuned(self, client: str = "0") -> Program:
         """Get currently tuned program."""
         tuned = await self._request("tv/getTuned", params={"clientAddr": client})
-        return Program.from_dict(tuned)
+        return self._program(client, tuned)
+
+    def _program(self, client: str, data: dict) -> Program:
+        """Return the tuned program, reusing the previous one when unchanged."""
+        fingerprint = Program.fingerprint(data)
+        previous = self._programs.get(client)
+
+        if previous is not None and previous[0] == fingerprint:
+            program = previous[1]
+            position = data.get("offset", 0)
+
+            if program.position == position:
+                return program
+
+            if self._program_pool is not None:
+                program = self._program_pool.with_position(program, position)
+            else:
+                program = program.with_position(position)
+        else:
+            program = Program.from_dict(data, self._program_pool)
+
+        self._programs[client] = (fingerprint, program)
+        return program
+
+    def watcher(
+        self,
+        client: str = "0",
+        interval: Optional[float] = None,
+        scheduler: PollScheduler = None,
+    ) -> StateWatcher:
+        """Return the shared state watcher of receiver client.
+
+        An interval or scheduler given for an existing watcher replaces its
+        polling schedule for every listener.
+        """
+        watcher = self._watchers.get(client)
+
+        if watcher is None:
+            watcher = self._watchers[client] = StateWatcher(
+                self, client, 5 if interval is None else interval, scheduler
+            )
+        elif scheduler is not None:
+            watcher.scheduler = scheduler
+        elif interval is not None:
+            watcher.scheduler = PollScheduler(interval)
+
+        return watcher
+
+    def watch(
+        self,
+        client: str = "0",
+        interval: Optional[float] = None,
+        scheduler: PollScheduler = None,
+    ) -> AsyncIterator[StateChange]:
+        """Yield changes in state of receiver client."""
+        return self.watcher(client, interval, scheduler).events()
+
+    async def warm(self) -> None:
+        """Open a keep-alive connection to the receiver with a cheap request."""
+        result = await self._fetch("info/getVersion", "GET", None, None)
+        result.unwrap()
+
+    def _keepalive(self) -> float:
+        """Return the seconds idle connections to the receiver stay open.
+
+        Sessions without a known keep-alive timeout are assumed to use the
+        aiohttp default, unless their connector closes every connection.
+        """
+        if self.keepalive_timeout is not None:
+            return self.keepalive_timeout
+
+        session = self._session
+        if session is None:
+            return 0
+
+        if self._close_session:
+            return self._session_manager.keepalive_timeout(session)
+
+        connector = session.connector
+        if connector is None or connector.force_close:
+            return 0
+
+        return KEEPALIVE_TIMEOUT
+
+    def _ping_interval(self) -> Optional[float]:
+        """Return the idle seconds before a keep-warm ping, if any.
+
+        Intervals reaching the keep-alive timeout are halved to it, so the
+        connection cannot expire between pings.
+        """
+        timeout = self._keepalive()
+        if not self.keep_warm or not timeout:
+            return None
+
+        return self.keep_warm if self.keep_warm < timeout else timeout / 2
+
+    async def _keep_warm(self) -> None:
+        """Keep a connection to the receiver open while idle.
+
+        Pings are left out of the latency statistics of the receiver.
+        """
+        _WARMING.set(True)
+
+        while True:
+            interval = self._ping_interval()
+            if interval is None:
+                self._warm_task = None
+                return
+
+            last = self._last_response
+            delay = interval if last is None else interval - (monotonic() - last)
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            try:
+                await self.warm()
+            except DIRECTVError:
+                pass
+
+            await asyncio.sleep(interval)
 
     async def close(self) -> None:
-        """Close open client session."""
+        """Close open client session or release the shared one."""
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+            self._warm_task = None
+
+        for watcher in self._watchers.values():
+            await watcher.stop()
+
         if self._session and self._close_session:
-            await self._session.close()
+            session, self._session = self._session, None
+            self._close_session = False
+            await self._session_manager.release(session)
 
     async def __aenter__(self) -> "DIRECTV":
         """Async enter."""
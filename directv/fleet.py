@@ -0,0 +1,197 @@
+"""Asynchronous Python client for fleets of DirecTV receivers."""
+import asyncio
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+
+import aiohttp
+import async_timeout
+
+from .breaker import CircuitBreaker
+from .directv import DIRECTV
+from .exceptions import DIRECTVConnectionError, DIRECTVError
+from .models import BulkTune, Device, State
+from .pool import ProgramPool
+from .queue import RequestQueue
+from .session import SessionManager
+
+
+class DIRECTVFleet:
+    """Main class for handling connections with many DirecTV receivers."""
+
+    def __init__(
+        self,
+        hosts: Iterable[str] = (),
+        concurrency: int = 50,
+        deadline: Optional[float] = 10,
+        limit_per_host: int = 2,
+        circuit_breaker: bool = False,
+        request_queue: bool = False,
+        intern_programs: bool = True,
+        session: aiohttp.client.ClientSession = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize fleet of receivers.
+
+        Circuit breakers and request queues are created per receiver when
+        enabled. Other options are passed to, and shared by, every receiver.
+        """
+        self._session = session
+        self._session_manager = SessionManager(
+            limit=concurrency, limit_per_host=limit_per_host
+        )
+        self._options = kwargs
+        self._receivers: Dict[str, DIRECTV] = {}
+
+        self.circuit_breaker = circuit_breaker
+        self.request_queue = request_queue
+        self.program_pool = ProgramPool() if intern_programs else None
+        self.concurrency = concurrency
+        self.deadline = deadline
+        self.limit_per_host = limit_per_host
+
+        for host in hosts:
+            self.add(host)
+
+    @property
+    def receivers(self) -> Dict[str, DIRECTV]:
+        """Return the receivers of the fleet keyed by host."""
+        return self._receivers
+
+    def add(self, host: str, **kwargs: Any) -> DIRECTV:
+        """Add a receiver to the fleet."""
+        options = {**self._options, **kwargs}
+        if self.circuit_breaker:
+            options.setdefault("circuit_breaker", CircuitBreaker())
+        if self.request_queue:
+            options.setdefault("request_queue", RequestQueue())
+        if self.program_pool is not None:
+            options.setdefault("program_pool", self.program_pool)
+
+        if self._session is None:
+            options.setdefault("session_manager", self._session_manager)
+
+        receiver = DIRECTV(host, session=self._session, **options)
+        self._receivers[host] = receiver
+        return receiver
+
+    async def remove(self, host: str) -> None:
+        """Remove a receiver from the fleet and close its connections."""
+        receiver = self._receivers.pop(host, None)
+
+        if receiver is not None:
+            await receiver.close()
+
+    async def _gather(
+        self, method: Callable[[DIRECTV], Awaitable[Any]]
+    ) -> Dict[str, Any]:
+        """Run a call against every receiver with bounded concurrency."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(receiver: DIRECTV) -> Any:
+            async with semaphore:
+                try:
+                    with async_timeout.timeout(self.deadline):
+                        return await method(receiver)
+                except asyncio.TimeoutError:
+                    return DIRECTVConnectionError(
+                        f"Deadline exceeded while polling receiver {receiver.host}"
+                    )
+                except DIRECTVError as exception:
+                    return exception
+
+        hosts = list(self._receivers)
+        results = await asyncio.gather(
+            *(run(self._receivers[host]) for host in hosts)
+        )
+
+        return dict(zip(hosts, results))
+
+    async def update(
+        self, full_update: bool = False
+    ) -> Dict[str, Union[Device, DIRECTVError]]:
+        """Get information about every receiver in the fleet."""
+        return await self._gather(lambda receiver: receiver.update(full_update))
+
+    async def state(self, client: str = "0") -> Dict[str, Union[State, DIRECTVError]]:
+        """Get state of a client on every receiver in the fleet."""
+        return await self._gather(lambda receiver: receiver.state(client))
+
+    async def status(self, client: str = "0") -> Dict[str, Union[str, DIRECTVError]]:
+        """Get basic status of a client on every receiver in the fleet."""
+        return await self._gather(lambda receiver: receiver.status(client))
+
+    async def tune(
+        self, channel: str, client: str = "0", hosts: Iterable[str] = None
+    ) -> BulkTune:
+        """Change the channel on many receivers at the same moment.
+
+        Connections to every receiver are established first, then all
+        tune requests are released together.
+        """
+        targets = list(self._receivers if hosts is None else hosts)
+        loop = asyncio.get_event_loop()
+        warmed = [loop.create_future() for _ in targets]
+        release = asyncio.Event()
+
+        async def run(
+            receiver: DIRECTV, ready: asyncio.Future
+        ) -> Union[float, DIRECTVError]:
+            try:
+                with async_timeout.timeout(self.deadline):
+                    await receiver.status(client)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                ready.set_result(None)
+
+            await release.wait()
+            started = monotonic()
+
+            try:
+                with async_timeout.timeout(self.deadline):
+                    await receiver.tune(channel, client)
+            except asyncio.TimeoutError:
+                return DIRECTVConnectionError(
+                    f"Deadline exceeded while tuning receiver {receiver.host}"
+                )
+            except DIRECTVError as exception:
+                return exception
+
+            return monotonic() - started
+
+        tasks = asyncio.gather(
+            *(
+                run(self._receivers[host], ready)
+                for host, ready in zip(targets, warmed)
+            )
+        )
+        await asyncio.gather(*warmed)
+        release.set()
+        results = await tasks
+
+        return BulkTune(
+            channel=channel,
+            latencies={
+                host: result
+                for host, result in zip(targets, results)
+                if isinstance(result, float)
+            },
+            errors={
+                host: result
+                for host, result in zip(targets, results)
+                if isinstance(result, DIRECTVError)
+            },
+        )
+
+    async def close(self) -> None:
+        """Close open client sessions."""
+        for receiver in self._receivers.values():
+            await receiver.close()
+
+    async def __aenter__(self) -> "DIRECTVFleet":
+        """Async enter."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Async exit."""
+        await self.close()
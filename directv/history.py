@@ -0,0 +1,145 @@
+"""State history of DirecTV receiver clients."""
+from array import array
+from bisect import bisect_left, bisect_right
+from time import time
+from typing import Any, Dict, Hashable, Iterator, NamedTuple, Optional
+
+from .models import State
+from .utils import parse_channel_number
+
+COLUMNS = (
+    ("at", "d"),
+    ("standby", "B"),
+    ("major", "l"),
+    ("minor", "l"),
+    ("program_id", "q"),
+    ("position", "q"),
+)
+
+
+class HistoryWindow(NamedTuple):
+    """Views of the samples of a client within a time range."""
+
+    at: memoryview
+    standby: memoryview
+    major: memoryview
+    minor: memoryview
+    program_id: memoryview
+    position: memoryview
+
+
+def _program_id(value: Any) -> int:
+    """Return the numeric program id, or zero when unknown."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class StateBuffer:
+    """Fixed capacity ring buffer of the states of one client.
+
+    Every sample is written twice, so any window of the buffer is one
+    contiguous slice and can be returned as a view instead of a copy.
+    Views are only valid until the samples they cover are overwritten.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initialize an empty state buffer."""
+        self.capacity = capacity
+        self._count = 0
+        self._columns = {
+            name: array(typecode, bytes(array(typecode).itemsize * capacity * 2))
+            for name, typecode in COLUMNS
+        }
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return min(self._count, self.capacity)
+
+    def append(self, state: State, at: Optional[float] = None) -> None:
+        """Add the state of the client as the newest sample."""
+        program = state.program
+        values = [time() if at is None else at, state.standby, 0, 0, 0, 0]
+
+        if program is not None:
+            major, minor = parse_channel_number(program.channel)
+            values[2:] = (
+                int(major),
+                int(minor),
+                _program_id(program.program_id),
+                program.position,
+            )
+
+        index = self._count % self.capacity
+        mirror = index + self.capacity
+
+        for (name, _), value in zip(COLUMNS, values):
+            column = self._columns[name]
+            column[index] = column[mirror] = value
+
+        self._count += 1
+
+    def _window(self, start: int, stop: int) -> HistoryWindow:
+        """Return views of the held samples from start up to stop."""
+        offset = (self._count - len(self)) % self.capacity
+        window = slice(offset + start, offset + stop)
+
+        return HistoryWindow(
+            **{
+                name: memoryview(column)[window]
+                for name, column in self._columns.items()
+            }
+        )
+
+    def latest(self, count: Optional[int] = None) -> HistoryWindow:
+        """Return views of the newest samples, or all held samples."""
+        size = len(self)
+        count = size if count is None else min(count, size)
+        return self._window(size - count, size)
+
+    def between(self, start: float, end: float) -> HistoryWindow:
+        """Return views of the samples taken from start up to end."""
+        at = self.latest().at
+
+        return self._window(bisect_left(at, start), bisect_right(at, end))
+
+
+class StateHistory:
+    """Store of the state history of many receiver clients.
+
+    Clients are keyed by any hashable, receivers record their clients as
+    ``(host, client)`` so one history can be shared by a fleet.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initialize an empty state history."""
+        self.capacity = capacity
+        self._buffers: Dict[Hashable, StateBuffer] = {}
+
+    def __contains__(self, client: object) -> bool:
+        """Return if samples were recorded for a client."""
+        return client in self._buffers
+
+    def __getitem__(self, client: Hashable) -> StateBuffer:
+        """Return the state buffer of a client."""
+        return self._buffers[client]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the recorded clients."""
+        return iter(self._buffers)
+
+    def __len__(self) -> int:
+        """Return the number of recorded clients."""
+        return len(self._buffers)
+
+    def record(
+        self, client: Hashable, state: State, at: Optional[float] = None
+    ) -> None:
+        """Add a state of a client to its history."""
+        buffer = self._buffers.get(client)
+
+        if buffer is None:
+            buffer = self._buffers[client] = StateBuffer(self.capacity)
+
+        buffer.append(state, at)
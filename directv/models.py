@@ -2,11 +2,36 @@
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from .exceptions import DIRECTVError
+from .exceptions import DIRECTVAccessRestricted, DIRECTVConnectionError, DIRECTVError
 from .utils import combine_channel_number
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .pool import ProgramPool
+
+
+def _info_fields(data: dict) -> Dict[str, Any]:
+    """Return the Info fields of a DirecTV API response."""
+    receiver_id = data.get("receiverId", "")
+
+    return dict(
+        brand="DirecTV",
+        receiver_id="".join(receiver_id.split()),
+        version=data.get("stbSoftwareVersion", "Unknown"),
+    )
+
+
+def _location_fields(data: dict) -> Dict[str, Any]:
+    """Return the Location fields of a DirecTV API response."""
+    address = data.get("clientAddr", "")
+
+    return dict(
+        client=address != "0",
+        name=data.get("locationName", "Receiver"),
+        address=address,
+    )
+
 
 @dataclass(frozen=True)
 class Info:
@@ -19,13 +44,7 @@ class Info:
     @staticmethod
     def from_dict(data: dict):
         """Return Info object from DirecTV API response."""
-        receiver_id = data.get("receiverId", "")
-
-        return Info(
-            brand="DirecTV",
-            receiver_id="".join(receiver_id.split()),
-            version=data.get("stbSoftwareVersion", "Unknown"),
-        )
+        return Info(**_info_fields(data))
 
 
 @dataclass(frozen=True)
@@ -39,13 +58,70 @@ class Location:
     @staticmethod
     def from_dict(data: dict):
         """Return Info object from DirecTV API response."""
-        address = data.get("clientAddr", "")
+        return Location(**_location_fields(data))
+
+
+def _program_fields(data: dict) -> Dict[str, Any]:
+    """Return the Program fields of a DirecTV API response."""
+    major = data.get("major", 0)
+    minor = data.get("minor", 65535)
+    episode_title = data.get("episodeTitle", None)
+    music = data.get("music", {})
+    music_title = music.get("title", None)
+    program_type = "movie"
+    if episode_title is not None:
+        program_type = "tvshow"
+    elif music_title is not None:
+        program_type = "music"
+    start_time = data.get("startTime", None)
+    if start_time:
+        start_time = datetime.fromtimestamp(start_time, timezone.utc)
+    unique_id = data.get("uniqueId", None)
+
+    return dict(
+        channel=combine_channel_number(major, minor),
+        channel_name=data.get("callsign", None),
+        program_id=data.get("programId", None),
+        program_type=program_type,
+        duration=data.get("duration", 0),
+        title=data.get("title", None),
+        episode_title=episode_title,
+        music_title=music_title,
+        music_album=music.get("cd", None),
+        music_artist=music.get("by", None),
+        ondemand=data.get("isVod", False),
+        partial=data.get("isPartial", False),
+        payperview=data.get("isPpv", False),
+        position=data.get("offset", 0),
+        purchased=data.get("isPurchased", False),
+        rating=data.get("rating", None),
+        recorded=(unique_id is not None),
+        recording=data.get("isRecording", False),
+        start_time=start_time,
+        unique_id=unique_id,
+        viewed=data.get("isViewed", False),
+    )
+
 
-        return Location(
-            client=address != "0",
-            name=data.get("locationName", "Receiver"),
-            address=address,
-        )
+PROGRAM_STABLE_KEYS = (
+    "major",
+    "minor",
+    "programId",
+    "startTime",
+    "uniqueId",
+    "duration",
+    "callsign",
+    "title",
+    "episodeTitle",
+    "music",
+    "rating",
+    "isPartial",
+    "isPpv",
+    "isPurchased",
+    "isRecording",
+    "isViewed",
+    "isVod",
+)
 
 
 @dataclass(frozen=True)
@@ -75,46 +151,24 @@ class Program:
     unique_id: int
 
     @staticmethod
-    def from_dict(data: dict):
+    def fingerprint(data: dict) -> Tuple[Any, ...]:
+        """Return the fields of an API response that only change between airings."""
+        return tuple(map(data.get, PROGRAM_STABLE_KEYS))
+
+    def with_position(self, position: int) -> "Program":
+        """Return a copy of the program at another position."""
+        program = object.__new__(Program)
+        program.__dict__.update(self.__dict__)
+        program.__dict__["position"] = position
+        return program
+
+    @staticmethod
+    def from_dict(data: dict, pool: "ProgramPool" = None):
         """Return Info object from DirecTV API response."""
-        major = data.get("major", 0)
-        minor = data.get("minor", 65535)
-        episode_title = data.get("episodeTitle", None)
-        music = data.get("music", {})
-        music_title = music.get("title", None)
-        program_type = "movie"
-        if episode_title is not None:
-            program_type = "tvshow"
-        elif music_title is not None:
-            program_type = "music"
-        start_time = data.get("startTime", None)
-        if start_time:
-            start_time = datetime.fromtimestamp(start_time, timezone.utc)
-        unique_id = data.get("uniqueId", None)
-
-        return Program(
-            channel=combine_channel_number(major, minor),
-            channel_name=data.get("callsign", None),
-            program_id=data.get("programId", None),
-            program_type=program_type,
-            duration=data.get("duration", 0),
-            title=data.get("title", None),
-            episode_title=episode_title,
-            music_title=music_title,
-            music_album=music.get("cd", None),
-            music_artist=music.get("by", None),
-            ondemand=data.get("isVod", False),
-            partial=data.get("isPartial", False),
-            payperview=data.get("isPpv", False),
-            position=data.get("offset", 0),
-            purchased=data.get("isPurchased", False),
-            rating=data.get("rating", None),
-            recorded=(unique_id is not None),
-            recording=data.get("isRecording", False),
-            start_time=start_time,
-            unique_id=unique_id,
-            viewed=data.get("isViewed", False),
-        )
+        if pool is not None:
+            return pool.from_dict(data)
+
+        return Program(**_program_fields(data))
 
 
 @dataclass(frozen=True)
@@ -128,6 +182,107 @@ class State:
     at: datetime = datetime.utcnow()
 
 
+@dataclass(frozen=True)
+class StateChange:
+    """Object holding a change in state of a single receiver client."""
+
+    client: str
+    changes: Tuple[str, ...]
+    previous: Optional[State]
+    current: State
+
+
+@dataclass(frozen=True)
+class TuneConfirmation:
+    """Object holding a confirmed channel change of a receiver client."""
+
+    program: Program
+    elapsed: float
+
+
+@dataclass(frozen=True)
+class BulkTune:
+    """Object holding the outcome of tuning many receivers at once."""
+
+    channel: str
+    latencies: Dict[str, float]
+    errors: Dict[str, DIRECTVError]
+
+    @property
+    def max_latency(self) -> Optional[float]:
+        """Return the slowest tune latency in seconds."""
+        return max(self.latencies.values(), default=None)
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        """Return the mean tune latency in seconds."""
+        if not self.latencies:
+            return None
+
+        return sum(self.latencies.values()) / len(self.latencies)
+
+    @property
+    def skew(self) -> Optional[float]:
+        """Return the seconds between the first and last receiver tuning."""
+        if not self.latencies:
+            return None
+
+        return max(self.latencies.values()) - min(self.latencies.values())
+
+
+class RequestResult:
+    """Object holding the outcome of a request to a receiver.
+
+    Failed requests carry an error payload instead of raising. A missing
+    status means the receiver could not be reached at all.
+    """
+
+    __slots__ = ("status", "data", "error", "message", "cause")
+
+    def __init__(
+        self,
+        status: Optional[int],
+        data: Any = None,
+        error: Optional[dict] = None,
+        message: str = "",
+        cause: Optional[BaseException] = None,
+    ) -> None:
+        """Initialize result of a request."""
+        self.status = status
+        self.data = data
+        self.error = error
+        self.message = message
+        self.cause = cause
+
+    @property
+    def ok(self) -> bool:
+        """Return if the request succeeded."""
+        return self.error is None
+
+    @property
+    def reachable(self) -> bool:
+        """Return if the receiver responded to the request."""
+        return self.status is not None
+
+    @property
+    def restricted(self) -> bool:
+        """Return if access to the receiver is restricted."""
+        return self.status == 403
+
+    def unwrap(self) -> Any:
+        """Return the response body or raise the error of the request."""
+        if self.error is None:
+            return self.data
+
+        if self.status is None:
+            raise DIRECTVConnectionError(self.message) from self.cause
+
+        if self.status == 403:
+            raise DIRECTVAccessRestricted(self.message, self.error)
+
+        raise DIRECTVError(self.message, self.error)
+
+
 class Device:
     """Object holding all information of receiver."""
 
@@ -0,0 +1,134 @@
+"""Program interning pool for DirecTV."""
+from collections import OrderedDict
+from sys import intern
+from typing import Any, Dict, Hashable, Tuple
+from weakref import WeakValueDictionary
+
+from .models import Program, _program_fields
+
+INTERNED_FIELDS = (
+    "channel",
+    "channel_name",
+    "program_id",
+    "program_type",
+    "title",
+    "episode_title",
+    "music_title",
+    "music_album",
+    "music_artist",
+    "rating",
+)
+
+
+def _airing(program: Program) -> Hashable:
+    """Return the key of the airing of a program."""
+    return (program.program_id, program.channel, program.start_time)
+
+
+def _same_airing(program: Program, other: Program) -> bool:
+    """Return if two programs only differ in their position."""
+    fields = dict(program.__dict__)
+    fields["position"] = other.position
+    return fields == other.__dict__
+
+
+class ProgramPool:
+    """Pool sharing one Program between clients watching the same airing.
+
+    Every airing, keyed by program id, channel and start time, is held at
+    position zero in a least recently used cache of ``max_size`` airings.
+    Programs at a position are copies of their airing sharing its values,
+    and are held weakly so clients at the same position share one object.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initialize an empty program pool."""
+        self.max_size = max_size
+        self._airings: "OrderedDict[Hashable, Program]" = OrderedDict()
+        self._programs: "WeakValueDictionary[Tuple[Hashable, int], Program]" = (
+            WeakValueDictionary()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of pooled airings."""
+        return len(self._airings)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return lookup statistics of the pool.
+
+        A hit is counted whenever an existing program object is shared.
+        """
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._airings),
+            "programs": len(self._programs),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset(self) -> None:
+        """Reset lookup statistics of the pool."""
+        self.hits = 0
+        self.misses = 0
+
+    def from_dict(self, data: dict) -> Program:
+        """Return the pooled Program object for a DirecTV API response."""
+        fields = _program_fields(data)
+
+        for name in INTERNED_FIELDS:
+            value = fields[name]
+            if isinstance(value, str):
+                fields[name] = intern(value)
+
+        position = fields["position"]
+        fields["position"] = 0
+
+        key = (fields["program_id"], fields["channel"], fields["start_time"])
+        airing = self._airings.get(key)
+
+        if airing is None or airing.__dict__ != fields:
+            airing = self._store(key, Program(**fields))
+        else:
+            self._airings.move_to_end(key)
+
+        return self._at(key, airing, position)
+
+    def with_position(self, program: Program, position: int) -> Program:
+        """Return the pooled copy of a program at another position."""
+        key = _airing(program)
+        airing = self._airings.get(key)
+
+        if airing is None or not _same_airing(airing, program):
+            airing = self._store(key, program.with_position(0))
+        else:
+            self._airings.move_to_end(key)
+
+        return self._at(key, airing, position)
+
+    def _store(self, key: Hashable, airing: Program) -> Program:
+        """Add an airing to the pool, evicting the least recently used."""
+        self._airings[key] = airing
+        self._airings.move_to_end(key)
+
+        while len(self._airings) > self.max_size:
+            self._airings.popitem(last=False)
+
+        return airing
+
+    def _at(self, key: Hashable, airing: Program, position: int) -> Program:
+        """Return the shared program of an airing at a position."""
+        program = self._programs.get((key, position))
+
+        if program is not None and _same_airing(airing, program):
+            self.hits += 1
+            return program
+
+        self.misses += 1
+        program = airing if position == 0 else airing.with_position(position)
+        self._programs[(key, position)] = program
+        return program
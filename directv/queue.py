@@ -0,0 +1,91 @@
+"""Request queue for DirecTV."""
+import asyncio
+import heapq
+import itertools
+import random
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from .const import PRIORITY_BACKGROUND
+from .models import RequestResult
+
+
+def is_conflict(error: Any) -> bool:
+    """Return if the receiver rejected a request as conflicting."""
+    if not isinstance(error, dict):
+        return False
+
+    status = error.get("status") or {}
+    return "conflict" in str(status.get("msg", "")).lower()
+
+
+class RequestQueue:
+    """Priority queue limiting the concurrent requests to a receiver.
+
+    Requests with a lower priority value are sent first. Requests the
+    receiver rejects as conflicting are retried up to ``retries`` times
+    with a jittered exponential backoff starting at ``backoff`` seconds.
+    """
+
+    def __init__(
+        self, concurrency: int = 1, retries: int = 3, backoff: float = 0.25
+    ) -> None:
+        """Initialize an empty request queue."""
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self._active = 0
+        self._counter = itertools.count()
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+
+    @property
+    def pending(self) -> int:
+        """Return the number of requests waiting for their turn."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    async def acquire(self, priority: int = PRIORITY_BACKGROUND) -> None:
+        """Wait for a turn to send a request."""
+        if self._active < self.concurrency and not self.pending:
+            self._active += 1
+            return
+
+        waiter = asyncio.get_event_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Hand the turn to the next waiting request."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._active -= 1
+
+    async def run(
+        self,
+        factory: Callable[[], Awaitable[RequestResult]],
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> RequestResult:
+        """Send a request in turn, retrying it on conflicts."""
+        attempt = 0
+
+        while True:
+            await self.acquire(priority)
+            try:
+                result = await factory()
+            finally:
+                self.release()
+
+            if attempt >= self.retries or not is_conflict(result.error):
+                return result
+
+            delay = self.backoff * 2 ** attempt
+            await asyncio.sleep(random.uniform(delay / 2, delay))
+            attempt += 1
@@ -0,0 +1,118 @@
+"""Polling schedules for DirecTV."""
+from dataclasses import dataclass
+from typing import Optional
+
+from .models import State
+
+
+@dataclass(frozen=True)
+class PollTier:
+    """Object holding the polling configuration of an activity tier."""
+
+    interval: float
+    max_interval: float
+    backoff: float = 2
+
+
+class PollScheduler:
+    """Polling schedule with a fixed interval."""
+
+    def __init__(self, interval: float = 5) -> None:
+        """Initialize polling schedule."""
+        self.interval = interval
+
+    def next_interval(self, state: Optional[State]) -> float:
+        """Return the seconds to wait before polling again."""
+        return self.interval
+
+
+class ProgramBoundaryScheduler(PollScheduler):
+    """Polling schedule that follows the boundaries of the tuned program.
+
+    Polls every ``min_interval`` seconds within ``window`` seconds of the
+    expected end of the tuned program and backs off up to ``max_interval``
+    seconds in the middle of long programs. Programs running past their
+    expected end are polled every ``interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        interval: float = 5,
+        min_interval: float = 1,
+        max_interval: float = 30,
+        window: float = 15,
+    ) -> None:
+        """Initialize polling schedule."""
+        super().__init__(interval)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.window = window
+
+    def next_interval(self, state: Optional[State]) -> float:
+        """Return the seconds to wait before polling again."""
+        program = state.program if state is not None else None
+
+        if program is None or not program.duration:
+            return self.interval
+
+        remaining = program.duration - program.position
+
+        if remaining < -self.window:
+            return self.interval
+
+        if remaining <= self.window:
+            return self.min_interval
+
+        return max(self.min_interval, min(self.max_interval, remaining - self.window))
+
+
+class TieredScheduler(PollScheduler):
+    """Polling schedule with tiers for active, standby and dead clients.
+
+    Active clients are polled by the ``active`` schedule. Clients in
+    standby, and clients that are unavailable or unauthorized, are polled
+    at the interval of their tier which grows by its backoff factor for
+    every poll spent in that tier. The schedule keeps track of the tier of
+    a single client and must not be shared between watchers.
+    """
+
+    def __init__(
+        self,
+        active: PollScheduler = None,
+        standby: PollTier = PollTier(interval=30, max_interval=300),
+        dead: PollTier = PollTier(interval=60, max_interval=3600),
+    ) -> None:
+        """Initialize polling schedule."""
+        super().__init__()
+        self.active = active or ProgramBoundaryScheduler()
+        self.tiers = {"standby": standby, "dead": dead}
+        self._tier: Optional[str] = None
+        self._streak = 0
+
+    @staticmethod
+    def tier(state: Optional[State]) -> str:
+        """Return the activity tier of a client state."""
+        if state is None or (state.available and not state.standby):
+            return "active"
+
+        if state.available and state.authorized:
+            return "standby"
+
+        return "dead"
+
+    def next_interval(self, state: Optional[State]) -> float:
+        """Return the seconds to wait before polling again."""
+        tier = self.tier(state)
+
+        if tier != self._tier:
+            self._tier = tier
+            self._streak = 0
+
+        if tier == "active":
+            return self.active.next_interval(state)
+
+        config = self.tiers[tier]
+        interval = config.interval * config.backoff ** self._streak
+        self._streak += 1
+
+        return min(config.max_interval, interval)
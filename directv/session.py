@@ -0,0 +1,78 @@
+"""Shared connection pools for DirecTV."""
+import asyncio
+from typing import Any, Dict, Optional
+from weakref import WeakKeyDictionary
+
+import aiohttp
+
+from .const import KEEPALIVE_TIMEOUT
+
+
+class SessionManager:
+    """Manager of client sessions shared by receivers on the same event loop.
+
+    Every event loop gets one session with a connection pool configured by
+    the connector options. Sessions are reference counted and closed once
+    released by every receiver that acquired them. Like aiohttp, the
+    connections per host are unlimited unless ``limit_per_host`` is set.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+        ttl_dns_cache: Optional[int] = 300,
+    ) -> None:
+        """Initialize session manager."""
+        self.options: Dict[str, Any] = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": ttl_dns_cache,
+        }
+        self._sessions: WeakKeyDictionary = WeakKeyDictionary()
+        self._references: Dict[aiohttp.ClientSession, int] = {}
+        self._keepalive: Dict[aiohttp.ClientSession, float] = {}
+
+    def configure(self, **options: Any) -> None:
+        """Change the connector options of sessions created from now on."""
+        self.options.update(options)
+
+    def acquire(self) -> aiohttp.ClientSession:
+        """Return the shared session of the running event loop."""
+        loop = asyncio.get_event_loop()
+        session = self._sessions.get(loop)
+
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(**self.options)
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[loop] = session
+            self._references[session] = 0
+            self._keepalive[session] = self.options["keepalive_timeout"] or 0
+
+        self._references[session] += 1
+        return session
+
+    def keepalive_timeout(self, session: aiohttp.ClientSession) -> float:
+        """Return the seconds idle connections of a shared session stay open."""
+        return self._keepalive.get(session, 0)
+
+    async def release(self, session: aiohttp.ClientSession) -> None:
+        """Release a shared session and close it when no longer used."""
+        references = self._references.get(session, 0) - 1
+
+        if references > 0:
+            self._references[session] = references
+            return
+
+        self._references.pop(session, None)
+        self._keepalive.pop(session, None)
+        for loop, shared in list(self._sessions.items()):
+            if shared is session:
+                del self._sessions[loop]
+
+        await session.close()
+
+
+SESSION_MANAGER = SessionManager()
@@ -0,0 +1,121 @@
+"""Request statistics for DirecTV."""
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """Object holding the measurements of a single request to a receiver."""
+
+    host: str
+    endpoint: str
+    status: Optional[int]
+    latency: float
+    size: int
+    error: Optional[str]
+    warm: bool
+
+
+class LatencyStats:
+    """Running count, mean and maximum of request latencies."""
+
+    __slots__ = ("count", "total", "maximum")
+
+    def __init__(self) -> None:
+        """Initialize empty latency statistics."""
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record the latency of a request."""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return the statistics as a dict."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.maximum,
+        }
+
+
+class EndpointStats:
+    """Request statistics of a single endpoint on a receiver."""
+
+    __slots__ = ("bytes", "buckets", "errors", "latency", "statuses")
+
+    def __init__(self) -> None:
+        """Initialize empty endpoint statistics."""
+        self.bytes = 0
+        self.buckets: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.errors: Dict[str, int] = {}
+        self.latency = LatencyStats()
+        self.statuses: Dict[str, int] = {}
+
+    def record(self, metrics: RequestMetrics) -> None:
+        """Record the measurements of a request."""
+        self.bytes += metrics.size
+        self.buckets[bisect_left(LATENCY_BUCKETS, metrics.latency)] += 1
+        self.latency.record(metrics.latency)
+
+        if metrics.error is not None:
+            self.errors[metrics.error] = self.errors.get(metrics.error, 0) + 1
+
+        if metrics.status is not None:
+            group = "403" if metrics.status == 403 else f"{metrics.status // 100}xx"
+            self.statuses[group] = self.statuses.get(group, 0) + 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dict."""
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ["inf"]
+
+        return {
+            "requests": self.latency.count,
+            "bytes": self.bytes,
+            "timeouts": self.errors.get("timeout", 0),
+            "errors": dict(self.errors),
+            "statuses": dict(self.statuses),
+            "latency": self.latency.as_dict(),
+            "histogram": dict(zip(bounds, self.buckets)),
+        }
+
+
+class StatsCollector:
+    """Collector of request statistics per receiver and endpoint.
+
+    Pass an instance as the instrumentation of one or more receivers.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty stats collector."""
+        self._endpoints: Dict[Tuple[str, str], EndpointStats] = {}
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        """Record the measurements of a request."""
+        key = (metrics.host, metrics.endpoint)
+        stats = self._endpoints.get(key)
+
+        if stats is None:
+            stats = self._endpoints[key] = EndpointStats()
+
+        stats.record(metrics)
+
+    def reset(self) -> None:
+        """Drop all collected statistics."""
+        self._endpoints.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Return the collected statistics keyed by host and endpoint."""
+        snapshot: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+        for (host, endpoint), stats in self._endpoints.items():
+            snapshot.setdefault(host, {})[endpoint] = stats.as_dict()
+
+        return snapshot
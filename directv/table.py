@@ -0,0 +1,165 @@
+"""Columnar tables of DirecTV programs."""
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from sys import intern
+from typing import Any, Dict, Iterable, List, Optional
+
+from .models import Program
+from .utils import combine_channel_number, parse_channel_number
+
+FLAG_ONDEMAND = 1
+FLAG_PARTIAL = 2
+FLAG_PAYPERVIEW = 4
+FLAG_PURCHASED = 8
+FLAG_RECORDED = 16
+FLAG_RECORDING = 32
+FLAG_VIEWED = 64
+
+FLAG_KEYS = (
+    ("isVod", FLAG_ONDEMAND),
+    ("isPartial", FLAG_PARTIAL),
+    ("isPpv", FLAG_PAYPERVIEW),
+    ("isPurchased", FLAG_PURCHASED),
+    ("isRecording", FLAG_RECORDING),
+    ("isViewed", FLAG_VIEWED),
+)
+
+STRING_COLUMNS = (
+    ("channel_name", "callsign"),
+    ("program_id", "programId"),
+    ("title", "title"),
+    ("episode_title", "episodeTitle"),
+    ("rating", "rating"),
+)
+
+MUSIC_COLUMNS = (
+    ("music_title", "title"),
+    ("music_album", "cd"),
+    ("music_artist", "by"),
+)
+
+
+def _intern(value: Any) -> Any:
+    """Return the interned value when it is a string."""
+    return intern(value) if isinstance(value, str) else value
+
+
+class ProgramTable:
+    """Columnar table of tuned programs.
+
+    Numeric fields are held in ``array`` columns and strings in interned
+    columns, so whole tables can be filtered and aggregated without
+    creating a Program per row.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty program table."""
+        self.major = array("l")
+        self.minor = array("l")
+        self.duration = array("q")
+        self.position = array("q")
+        self.start_time = array("q")
+        self.flags = array("B")
+        self.program_type: List[str] = []
+        self.unique_id: List[Optional[str]] = []
+        self.strings: Dict[str, List[Optional[str]]] = {
+            name: [] for name, _ in STRING_COLUMNS + MUSIC_COLUMNS
+        }
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.flags)
+
+    def append(self, data: dict) -> None:
+        """Add a row from a DirecTV API response."""
+        music = data.get("music", {})
+        unique_id = data.get("uniqueId", None)
+        flags = FLAG_RECORDED if unique_id is not None else 0
+
+        for key, flag in FLAG_KEYS:
+            if data.get(key, False):
+                flags |= flag
+
+        for name, key in STRING_COLUMNS:
+            self.strings[name].append(_intern(data.get(key, None)))
+
+        for name, key in MUSIC_COLUMNS:
+            self.strings[name].append(_intern(music.get(key, None)))
+
+        program_type = "movie"
+        if data.get("episodeTitle", None) is not None:
+            program_type = "tvshow"
+        elif music.get("title", None) is not None:
+            program_type = "music"
+
+        self.major.append(data.get("major", 0))
+        self.minor.append(data.get("minor", 65535))
+        self.duration.append(data.get("duration", 0))
+        self.position.append(data.get("offset", 0))
+        self.start_time.append(data.get("startTime", None) or 0)
+        self.flags.append(flags)
+        self.program_type.append(program_type)
+        self.unique_id.append(unique_id)
+
+    @staticmethod
+    def from_dicts(payloads: Iterable[dict]) -> "ProgramTable":
+        """Return ProgramTable object from many DirecTV API responses."""
+        table = ProgramTable()
+
+        for data in payloads:
+            table.append(data)
+
+        return table
+
+    def channel(self, index: int) -> str:
+        """Return the combined channel number of a row."""
+        return combine_channel_number(self.major[index], self.minor[index])
+
+    def where_channel(self, channel: str) -> List[int]:
+        """Return the rows tuned to a channel."""
+        major, minor = map(int, parse_channel_number(channel))
+
+        return [
+            index
+            for index, (row_major, row_minor) in enumerate(zip(self.major, self.minor))
+            if row_major == major and row_minor == minor
+        ]
+
+    def where_flag(self, flag: int) -> List[int]:
+        """Return the rows with a flag set."""
+        return [index for index, flags in enumerate(self.flags) if flags & flag]
+
+    def channel_counts(self) -> Dict[str, int]:
+        """Return the number of rows tuned to each channel."""
+        counts = Counter(zip(self.major, self.minor))
+
+        return {
+            combine_channel_number(major, minor): count
+            for (major, minor), count in counts.items()
+        }
+
+    def program(self, index: int) -> Program:
+        """Return the Program object of a row."""
+        flags = self.flags[index]
+        start_time = self.start_time[index]
+        strings = {name: column[index] for name, column in self.strings.items()}
+
+        return Program(
+            channel=self.channel(index),
+            ondemand=bool(flags & FLAG_ONDEMAND),
+            recorded=bool(flags & FLAG_RECORDED),
+            recording=bool(flags & FLAG_RECORDING),
+            viewed=bool(flags & FLAG_VIEWED),
+            program_type=self.program_type[index],
+            duration=self.duration[index],
+            partial=bool(flags & FLAG_PARTIAL),
+            payperview=bool(flags & FLAG_PAYPERVIEW),
+            position=self.position[index],
+            purchased=bool(flags & FLAG_PURCHASED),
+            start_time=(
+                datetime.fromtimestamp(start_time, timezone.utc) if start_time else None
+            ),
+            unique_id=self.unique_id[index],
+            **strings,
+        )
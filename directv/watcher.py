@@ -0,0 +1,168 @@
+"""State watcher for DirecTV."""
+import asyncio
+import logging
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .models import State, StateChange
+from .scheduler import PollScheduler
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .directv import DIRECTV
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CHANGES = ("authorized", "available", "standby", "channel", "program")
+
+
+def state_changes(previous: Optional[State], current: State) -> Tuple[str, ...]:
+    """Return the names of what changed between two states of a client."""
+    if previous is None:
+        return STATE_CHANGES
+
+    changes = [
+        name
+        for name in ("authorized", "available", "standby")
+        if getattr(previous, name) != getattr(current, name)
+    ]
+
+    old = previous.program
+    new = current.program
+
+    if (old and old.channel) != (new and new.channel):
+        changes.append("channel")
+
+    if (old and old.program_id) != (new and new.program_id):
+        changes.append("program")
+
+    return tuple(changes)
+
+
+class StateWatcher:
+    """Poll the state of a receiver client and notify listeners of changes."""
+
+    def __init__(
+        self,
+        dtv: "DIRECTV",
+        client: str = "0",
+        interval: float = 5,
+        scheduler: PollScheduler = None,
+    ) -> None:
+        """Initialize watcher of receiver client."""
+        self._dtv = dtv
+        self._callbacks: List[Callable[[StateChange], Any]] = []
+        self._queues: List["asyncio.Queue[Optional[StateChange]]"] = []
+        self._task: Optional[asyncio.Future] = None
+
+        self.client = client
+        self.scheduler = scheduler or PollScheduler(interval)
+        self.state: Optional[State] = None
+
+    @property
+    def running(self) -> bool:
+        """Return if the watcher is polling the receiver."""
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, callback: Callable[[StateChange], Any]) -> Callable[[], None]:
+        """Register a callback for state changes.
+
+        Returns a function that removes the callback again.
+        """
+        self._callbacks.append(callback)
+        self._start()
+
+        def unsubscribe() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+            self._stop_idle()
+
+        return unsubscribe
+
+    async def events(self) -> AsyncIterator[StateChange]:
+        """Yield state changes as they are detected until stopped."""
+        queue: "asyncio.Queue[Optional[StateChange]]" = asyncio.Queue()
+        self._queues.append(queue)
+        self._start()
+
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+
+                yield event
+        finally:
+            self._queues.remove(queue)
+            self._stop_idle()
+
+    async def poll(self) -> Optional[StateChange]:
+        """Poll the state once and notify listeners when it changed."""
+        state = await self._dtv.state(self.client)
+        previous, self.state = self.state, state
+
+        changes = state_changes(previous, state)
+        if not changes:
+            return None
+
+        event = StateChange(
+            client=self.client, changes=changes, previous=previous, current=state,
+        )
+
+        for callback in list(self._callbacks):
+            try:
+                result = callback(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in state change callback")
+
+        for queue in self._queues:
+            queue.put_nowait(event)
+
+        return event
+
+    async def stop(self) -> None:
+        """Stop polling the receiver and end all event streams."""
+        for queue in self._queues:
+            queue.put_nowait(None)
+
+        if self._task is None:
+            return
+
+        task, self._task = self._task, None
+        task.cancel()
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _start(self) -> None:
+        """Start polling the receiver if not already running."""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    def _stop_idle(self) -> None:
+        """Stop polling the receiver once nobody is listening."""
+        if not self._callbacks and not self._queues and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        """Poll the receiver until stopped."""
+        while True:
+            try:
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error polling state of %s", self._dtv.host)
+
+            await asyncio.sleep(self.scheduler.next_interval(self.state))
@@ -0,0 +1,55 @@
+"""Tests for DirecTV Viewing Analytics."""
+import json
+
+import pytest
+from directv.analytics import ViewingStats
+from directv.history import StateHistory
+from directv.models import Program, State
+
+from . import load_fixture
+
+DATA = json.loads(load_fixture("tv-get-tuned.json"))
+
+
+def _state(major: int = None) -> State:
+    """Return a state tuned to a channel, or in standby."""
+    if major is None:
+        return State(authorized=True, available=True, standby=True, program=None)
+
+    program = Program.from_dict({**DATA, "major": major})
+    return State(authorized=True, available=True, standby=False, program=program)
+
+
+def test_viewing_stats() -> None:
+    """Test viewing aggregates of recorded states."""
+    history = StateHistory()
+    for at, major in ((0, 206), (60, 206), (120, 231), (180, None), (300, 231)):
+        history.record("0", _state(major), at)
+    for at, major in ((3540, 206), (3600, 206), (3660, 206)):
+        history.record("2", _state(major), at)
+
+    stats = ViewingStats.from_history(history)
+
+    assert stats.channel_minutes == {"206": 4.0, "231": 1.0}
+    assert stats.client_minutes == {"0": 3.0, "2": 2.0}
+    assert stats.hour_minutes == {0: 4.0, 3600: 1.0}
+    assert stats.standby_ratios == {"0": pytest.approx(0.4), "2": 0.0}
+    assert stats.switch_rates == {"0": 20.0, "2": 0.0}
+
+
+def test_viewing_stats_gaps() -> None:
+    """Test gaps between samples and time ranges are left out."""
+    history = StateHistory()
+    for at, major in ((0, 206), (1000, 231), (1060, 231), (1120, 206)):
+        history.record("0", _state(major), at)
+
+    stats = ViewingStats.from_history(history, max_gap=300)
+    assert stats.channel_minutes == {"231": 2.0}
+    assert stats.switch_rates["0"] == 0.0
+
+    stats = ViewingStats.from_history(history, start=1060)
+    assert stats.client_minutes == {"0": 1.0}
+
+    stats = ViewingStats.from_history(history, end=0)
+    assert stats.client_minutes == {"0": 0.0}
+    assert stats.standby_ratios == {"0": 0.0}
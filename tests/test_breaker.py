@@ -0,0 +1,83 @@
+"""Tests for DirecTV Circuit Breaker."""
+import asyncio
+
+import directv.breaker as breaker
+import pytest
+from aiohttp import ClientSession
+from directv import DIRECTV, DIRECTVConnectionError
+
+HOST = "1.2.3.4"
+PORT = 8080
+
+MATCH_HOST = f"{HOST}:{PORT}"
+
+
+def test_circuit_breaker(monkeypatch) -> None:
+    """Test the circuit opens, half-opens and closes."""
+    now = [1000.0]
+    monkeypatch.setattr(breaker, "monotonic", lambda: now[0])
+
+    circuit = breaker.CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    circuit.record_failure()
+    assert circuit.state == "closed"
+
+    circuit.record_failure()
+    assert circuit.state == "open"
+
+    now[0] += 30
+    assert circuit.state == "half-open"
+
+    circuit.record_success()
+    assert circuit.state == "closed"
+    assert circuit.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_fail_fast(aresponses, monkeypatch):
+    """Test requests fail fast until a probe succeeds."""
+    now = [1000.0]
+    monkeypatch.setattr(breaker, "monotonic", lambda: now[0])
+
+    async def response_handler(_):
+        await asyncio.sleep(2)
+        return aresponses.Response(body="Timeout!")
+
+    aresponses.add(MATCH_HOST, "/info/mode", "GET", response_handler)
+
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"status": {"code": 200, "commandResult": 0}}',
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/info/mode",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"mode": 0}',
+        ),
+    )
+
+    circuit = breaker.CircuitBreaker(failure_threshold=1, reset_timeout=30)
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(
+            HOST, session=session, request_timeout=0.1, circuit_breaker=circuit
+        )
+        assert await dtv.status() == "unavailable"
+        assert circuit.state == "open"
+
+        with pytest.raises(DIRECTVConnectionError):
+            await dtv._request("info/mode")
+
+        now[0] += 30
+        assert await dtv.status() == "active"
+        assert circuit.state == "closed"
@@ -0,0 +1,99 @@
+"""Tests for DirecTV Response Cache."""
+import directv.cache as cache
+
+
+def test_get_set() -> None:
+    """Test cacheable responses are stored per endpoint and params."""
+    responses = cache.ResponseCache()
+    responses.set("info/mode", {"clientAddr": "0"}, {"mode": 0})
+    responses.set("tv/tune", {"clientAddr": "0"}, {"status": "ok"})
+
+    assert responses.get("/info/mode", {"clientAddr": "0"}) == {"mode": 0}
+    assert responses.get("info/mode", {"clientAddr": "1"}) is None
+    assert responses.get("tv/tune", {"clientAddr": "0"}) is None
+
+
+def test_expiry(monkeypatch) -> None:
+    """Test responses expire after their endpoint ttl."""
+    now = [1000.0]
+    monkeypatch.setattr(cache, "monotonic", lambda: now[0])
+
+    responses = cache.ResponseCache()
+    responses.set("info/mode", {"clientAddr": "0"}, {"mode": 0})
+    responses.set("info/getVersion", None, {"version": "1.2"})
+
+    now[0] += 60
+    assert responses.get("info/mode", {"clientAddr": "0"}) is None
+    assert responses.get("info/getVersion") == {"version": "1.2"}
+
+
+def test_lru_eviction() -> None:
+    """Test least recently used responses are evicted first."""
+    responses = cache.ResponseCache(max_size=2)
+    responses.set("info/mode", {"clientAddr": "0"}, {"mode": 0})
+    responses.set("info/mode", {"clientAddr": "1"}, {"mode": 1})
+    responses.get("info/mode", {"clientAddr": "0"})
+    responses.set("info/mode", {"clientAddr": "2"}, {"mode": 0})
+
+    assert len(responses) == 2
+    assert responses.get("info/mode", {"clientAddr": "0"}) == {"mode": 0}
+    assert responses.get("info/mode", {"clientAddr": "1"}) is None
+
+
+def test_invalidate() -> None:
+    """Test invalidation only drops responses of the targeted client."""
+    responses = cache.ResponseCache()
+    responses.set("info/getVersion", None, {"version": "1.2"})
+    responses.set("info/mode", {"clientAddr": "0"}, {"mode": 0})
+    responses.set("tv/getTuned", {"clientAddr": "0"}, {"major": 231})
+    responses.set("info/mode", {"clientAddr": "1"}, {"mode": 0})
+
+    responses.invalidate("0")
+
+    assert len(responses) == 2
+    assert responses.get("info/mode", {"clientAddr": "0"}) is None
+
+    responses.invalidate()
+
+    assert not responses
+
+
+def test_generation() -> None:
+    """Test invalidation bumps the generation of the targeted client."""
+    responses = cache.ResponseCache()
+    before = responses.generation("0")
+
+    responses.invalidate("1")
+    assert responses.generation("0") == before
+
+    responses.invalidate("0")
+    assert responses.generation("0") != before
+
+    before = responses.generation("1")
+    responses.invalidate()
+    assert responses.generation("1") != before
+
+
+def test_receivers() -> None:
+    """Test responses of different receivers are kept apart."""
+    responses = cache.ResponseCache()
+    responses.set("info/mode", {"clientAddr": "0"}, {"mode": 0}, ("1.2.3.4", 8080))
+    responses.set("info/mode", {"clientAddr": "0"}, {"mode": 1}, ("1.2.3.5", 8080))
+
+    assert responses.get("info/mode", {"clientAddr": "0"}, ("1.2.3.4", 8080)) == {
+        "mode": 0
+    }
+    assert responses.get("info/mode", {"clientAddr": "0"}, ("1.2.3.5", 8080)) == {
+        "mode": 1
+    }
+    assert responses.get("info/mode", {"clientAddr": "0"}) is None
+
+    before = responses.generation("0", ("1.2.3.5", 8080))
+    responses.invalidate("0", ("1.2.3.4", 8080))
+
+    assert len(responses) == 1
+    assert responses.generation("0", ("1.2.3.5", 8080)) == before
+    assert responses.generation("0", ("1.2.3.4", 8080)) != before
+    responses.invalidate("0")
+    assert not responses
+    assert responses.generation("0", ("1.2.3.5", 8080)) != before
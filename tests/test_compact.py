@@ -0,0 +1,60 @@
+"""Tests for DirecTV Compact Models."""
+import json
+
+import directv.compact as compact
+import directv.models as models
+
+from . import load_fixture
+
+INFO = json.loads(load_fixture("info-get-version.json"))
+LOCATIONS = json.loads(load_fixture("info-get-locations.json"))["locations"]
+PROGRAM = json.loads(load_fixture("tv-get-tuned.json"))
+
+
+def test_info() -> None:
+    """Test the CompactInfo model."""
+    info = compact.CompactInfo.from_dict(INFO)
+
+    assert info
+    assert info == tuple(models.Info.from_dict(INFO).__dict__.values())
+    assert info.receiver_id == models.Info.from_dict(INFO).receiver_id
+
+
+def test_location() -> None:
+    """Test the CompactLocation model."""
+    for data in LOCATIONS:
+        location = compact.CompactLocation.from_dict(data)
+        assert location._asdict() == models.Location.from_dict(data).__dict__
+
+
+def test_program() -> None:
+    """Test the CompactProgram model."""
+    program = compact.CompactProgram.from_dict(PROGRAM)
+
+    assert program
+    assert program._asdict() == models.Program.from_dict(PROGRAM).__dict__
+    assert not hasattr(program, "__dict__")
+
+    moved = program.with_position(program.position + 60)
+    assert moved.position == program.position + 60
+    assert moved.title == program.title
+
+
+def test_state() -> None:
+    """Test the CompactState model."""
+    state = models.State(
+        authorized=True,
+        available=True,
+        standby=False,
+        program=models.Program.from_dict(PROGRAM),
+    )
+    compact_state = compact.CompactState.from_state(state)
+
+    assert compact_state.at == state.at
+    assert compact_state.standby is False
+    assert compact_state.program == compact.CompactProgram.from_dict(PROGRAM)
+
+    standby = compact.CompactState.from_state(
+        models.State(authorized=True, available=True, standby=True, program=None)
+    )
+    assert standby.program is None
@@ -1,8 +1,9 @@
 """Tests for DIRECTV."""
 import asyncio
+import json
 
 import pytest
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 from directv import DIRECTV
 from directv.exceptions import (
     DIRECTVAccessRestricted,
@@ -71,6 +72,89 @@ async def test_text_request(aresponses):
         assert response == "OK"
 
 
+@pytest.mark.asyncio
+async def test_json_request_without_content_type(aresponses):
+    """Test JSON response with wrong content type is handled correctly."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/mode",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "text/plain"},
+            text=load_fixture("info-mode.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        response = await dtv._request("/info/mode")
+        assert response["mode"] == 0
+
+
+@pytest.mark.asyncio
+async def test_json_decoder(aresponses):
+    """Test JSON responses are parsed by the configured decoder."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"status": {"code": 200, "commandResult": 0}}',
+        ),
+    )
+
+    decoded = []
+
+    def json_loads(content: bytes):
+        decoded.append(content)
+        return json.loads(content)
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session, json_loads=json_loads)
+        response = await dtv._request("/info/getVersion")
+        assert response["status"]["code"] == 200
+        assert isinstance(decoded[0], bytes)
+
+
+@pytest.mark.asyncio
+async def test_json_request_empty(aresponses):
+    """Test empty JSON response is handled correctly."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200, headers={"Content-Type": "application/json"}, body=b"",
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        with pytest.raises(DIRECTVError, match="empty API response"):
+            await dtv.update()
+
+
+@pytest.mark.asyncio
+async def test_json_request_invalid(aresponses):
+    """Test invalid JSON response is handled correctly."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200, headers={"Content-Type": "application/json"}, body=b"{",
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        with pytest.raises(DIRECTVError):
+            await dtv._request("/info/getVersion")
+
+
 @pytest.mark.asyncio
 async def test_internal_session(aresponses):
     """Test DIRECTV response is handled correctly."""
@@ -112,6 +196,148 @@ async def test_request_port(aresponses):
         assert response["status"]["commandResult"] == 0
 
 
+@pytest.mark.asyncio
+async def test_request_port_changed(aresponses):
+    """Test the cached request URL follows a changed port."""
+    aresponses.add(
+        f"{HOST}:{NON_STANDARD_PORT}",
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"status": {"code": 200, "commandResult": 0}}',
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(host=HOST, session=session)
+        assert dtv._url("info/getVersion").port == PORT
+
+        dtv.port = NON_STANDARD_PORT
+        response = await dtv._request("info/getVersion")
+        assert response["status"]["code"] == 200
+
+
+@pytest.mark.asyncio
+async def test_keep_warm(aresponses):
+    """Test idle connections are kept warm."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"status": {"code": 200, "commandResult": 0}}',
+        ),
+        repeat=10,
+    )
+
+    metrics = []
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(
+            HOST, session=session, keep_warm=0.05, instrumentation=metrics.append
+        )
+        await dtv.warm()
+        await asyncio.sleep(0.2)
+        await dtv._request("info/getVersion")
+        await dtv.close()
+
+        latency = dtv.stats["latency"]
+        assert latency["cold"]["count"] == 1
+        assert latency["warm"]["count"] == 1
+        assert latency["warm"]["max"] >= latency["warm"]["mean"] > 0
+
+        assert len(metrics) >= 4
+        assert all(metric.warm for metric in metrics[1:])
+
+
+@pytest.mark.asyncio
+async def test_keep_warm_clamped(aresponses):
+    """Test pings are sent within the keep-alive timeout of the pool."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"status": {"code": 200, "commandResult": 0}}',
+        ),
+        repeat=10,
+    )
+
+    metrics = []
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(
+            HOST,
+            session=session,
+            keep_warm=60,
+            keepalive_timeout=0.1,
+            instrumentation=metrics.append,
+        )
+        await dtv.warm()
+        await asyncio.sleep(0.2)
+        await dtv.close()
+
+        assert len(metrics) >= 3
+
+
+@pytest.mark.asyncio
+async def test_keep_warm_disabled(aresponses):
+    """Test disabling keep warm at runtime stops the pings."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"status": {"code": 200, "commandResult": 0}}',
+        ),
+        repeat=10,
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session, keep_warm=0.05)
+        await dtv.warm()
+        task = dtv._warm_task
+
+        dtv.keep_warm = None
+        await asyncio.sleep(0.1)
+
+        assert task.cancelled()
+        assert dtv._warm_task is None
+
+
+@pytest.mark.asyncio
+async def test_keepalive_timeout(aresponses):
+    """Test requests are only warm within the keep-alive timeout of the pool."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"status": {"code": 200, "commandResult": 0}}',
+        ),
+        repeat=2,
+    )
+
+    async with ClientSession(connector=TCPConnector(force_close=True)) as session:
+        dtv = DIRECTV(HOST, session=session)
+        await dtv._request("info/getVersion")
+        await dtv._request("info/getVersion")
+
+        latency = dtv.stats["latency"]
+        assert latency["cold"]["count"] == 2
+        assert latency["warm"]["count"] == 0
+
+
 @pytest.mark.asyncio
 async def test_timeout(aresponses):
     """Test request timeout from the DIRECTV server."""
@@ -209,3 +435,21 @@ async def test_http_error500_json(aresponses):
             assert response["status"]
             assert response["status"]["code"] == 500
             assert response["status"]["commandResult"] == 1
+
+
+@pytest.mark.asyncio
+async def test_http_error500_json_without_content_type(aresponses):
+    """Test HTTP 500 json response with wrong content type handling."""
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/tune",
+        "GET",
+        aresponses.Response(status=500, text=load_fixture("tv-tune-conflict.json")),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        with pytest.raises(DIRECTVError) as excinfo:
+            await dtv._request("tv/tune")
+
+        assert excinfo.value.args[1]["status"]["msg"] == "Request conflict."
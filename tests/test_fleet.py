@@ -0,0 +1,278 @@
+"""Tests for DIRECTVFleet."""
+import asyncio
+
+import pytest
+from aiohttp import ClientSession
+from directv import DIRECTVConnectionError, DIRECTVFleet
+from directv.cache import ResponseCache
+from directv.history import StateHistory
+from directv.models import State
+
+from . import load_fixture
+
+HOSTS = ["1.2.3.4", "1.2.3.5"]
+PORT = 8080
+
+
+@pytest.mark.asyncio
+async def test_status(aresponses):
+    """Test fleet status is aggregated per receiver."""
+    aresponses.add(
+        f"{HOSTS[0]}:{PORT}",
+        "/info/mode",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-mode.json"),
+        ),
+    )
+
+    aresponses.add(
+        f"{HOSTS[1]}:{PORT}",
+        "/info/mode",
+        "GET",
+        aresponses.Response(
+            status=500,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-mode-error.json"),
+        ),
+    )
+
+    async with DIRECTVFleet(HOSTS) as fleet:
+        response = await fleet.status()
+
+        assert response == {HOSTS[0]: "active", HOSTS[1]: "unavailable"}
+
+
+@pytest.mark.asyncio
+async def test_state(aresponses):
+    """Test fleet state is aggregated per receiver."""
+    aresponses.add(
+        f"{HOSTS[0]}:{PORT}",
+        "/info/mode",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-mode-standby.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        fleet = DIRECTVFleet(HOSTS[:1], session=session)
+        response = await fleet.state()
+
+        assert isinstance(response[HOSTS[0]], State)
+        assert response[HOSTS[0]].standby
+
+
+@pytest.mark.asyncio
+async def test_deadline(aresponses):
+    """Test slow receivers are bounded by the fleet deadline."""
+
+    async def response_handler(_):
+        await asyncio.sleep(2)
+        return aresponses.Response(body="Timeout!")
+
+    aresponses.add(
+        f"{HOSTS[0]}:{PORT}", "/info/getVersion", "GET", response_handler,
+    )
+
+    async with DIRECTVFleet(HOSTS[:1], deadline=0.5) as fleet:
+        response = await fleet.update()
+
+        assert isinstance(response[HOSTS[0]], DIRECTVConnectionError)
+
+
+@pytest.mark.asyncio
+async def test_tune(aresponses):
+    """Test fleet tune reports latency per receiver."""
+    for host in HOSTS:
+        aresponses.add(
+            f"{host}:{PORT}",
+            "/info/mode",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("info-mode.json"),
+            ),
+        )
+
+    aresponses.add(
+        f"{HOSTS[0]}:{PORT}",
+        "/tv/tune",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-tune.json"),
+        ),
+    )
+
+    aresponses.add(
+        f"{HOSTS[1]}:{PORT}",
+        "/tv/tune",
+        "GET",
+        aresponses.Response(
+            status=500,
+            headers={"Content-Type": "application/json"},
+            body=load_fixture("tv-tune-conflict.json"),
+        ),
+    )
+
+    async with DIRECTVFleet(HOSTS) as fleet:
+        response = await fleet.tune("231")
+
+        assert response.channel == "231"
+        assert list(response.latencies) == [HOSTS[0]]
+        assert list(response.errors) == [HOSTS[1]]
+        assert response.skew == 0
+        assert response.max_latency == response.mean_latency
+
+
+@pytest.mark.asyncio
+async def test_shared_programs(aresponses):
+    """Test receivers tuned to the same airing share one program."""
+    for host in HOSTS:
+        aresponses.add(
+            f"{host}:{PORT}",
+            "/info/mode",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("info-mode.json"),
+            ),
+        )
+
+        aresponses.add(
+            f"{host}:{PORT}",
+            "/tv/getTuned",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("tv-get-tuned.json"),
+            ),
+        )
+
+    async with DIRECTVFleet(HOSTS) as fleet:
+        states = await fleet.state()
+
+        assert states[HOSTS[0]].program is states[HOSTS[1]].program
+        assert fleet.program_pool.stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_session(aresponses):
+    """Test receivers share one connection pool managed by the fleet."""
+    for host in HOSTS:
+        aresponses.add(
+            f"{host}:{PORT}",
+            "/info/mode",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("info-mode.json"),
+            ),
+        )
+
+    fleet = DIRECTVFleet(HOSTS, concurrency=10, limit_per_host=1)
+    await fleet.status()
+
+    sessions = {receiver._session for receiver in fleet.receivers.values()}
+    assert len(sessions) == 1
+
+    session = sessions.pop()
+    assert session.connector.limit == 10
+    assert session.connector.limit_per_host == 1
+
+    await fleet.close()
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_shared_cache(aresponses):
+    """Test a cache shared by the fleet keeps responses per receiver."""
+    for host, fixture in zip(HOSTS, ("info-mode.json", "info-mode-standby.json")):
+        aresponses.add(
+            f"{host}:{PORT}",
+            "/info/mode",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture(fixture),
+            ),
+        )
+
+    async with DIRECTVFleet(HOSTS, cache=ResponseCache()) as fleet:
+        assert await fleet.status() == {HOSTS[0]: "active", HOSTS[1]: "standby"}
+        assert await fleet.status() == {HOSTS[0]: "active", HOSTS[1]: "standby"}
+
+
+@pytest.mark.asyncio
+async def test_shared_history(aresponses):
+    """Test a history shared by the fleet keeps samples per receiver."""
+    for host in HOSTS:
+        aresponses.add(
+            f"{host}:{PORT}",
+            "/info/mode",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("info-mode-standby.json"),
+            ),
+        )
+
+    async with DIRECTVFleet(HOSTS, history=StateHistory()) as fleet:
+        await fleet.state()
+
+        history = fleet.receivers[HOSTS[0]].history
+        assert sorted(history) == [(host, "0") for host in HOSTS]
+        assert all(len(history[client]) == 1 for client in history)
+
+
+@pytest.mark.asyncio
+async def test_per_receiver_options() -> None:
+    """Test circuit breakers and request queues are not shared."""
+    fleet = DIRECTVFleet(HOSTS, circuit_breaker=True, request_queue=True)
+    first, second = fleet.receivers.values()
+
+    assert first.circuit_breaker is not None
+    assert first.circuit_breaker is not second.circuit_breaker
+    assert first.request_queue is not None
+    assert first.request_queue is not second.request_queue
+
+    await fleet.close()
+
+
+@pytest.mark.asyncio
+async def test_remove(aresponses):
+    """Test removed receivers release the fleet connection pool."""
+    for host in HOSTS:
+        aresponses.add(
+            f"{host}:{PORT}",
+            "/info/mode",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("info-mode.json"),
+            ),
+        )
+
+    fleet = DIRECTVFleet(HOSTS)
+    await fleet.status()
+    session = fleet.receivers[HOSTS[0]]._session
+
+    await fleet.remove(HOSTS[0])
+    assert list(fleet.receivers) == HOSTS[1:]
+    assert not session.closed
+
+    await fleet.close()
+    assert session.closed
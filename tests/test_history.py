@@ -0,0 +1,72 @@
+"""Tests for DirecTV State History."""
+import json
+
+from directv.history import StateBuffer, StateHistory
+from directv.models import Program, State
+
+from . import load_fixture
+
+PROGRAM = Program.from_dict(json.loads(load_fixture("tv-get-tuned.json")))
+
+ACTIVE = State(authorized=True, available=True, standby=False, program=PROGRAM)
+STANDBY = State(authorized=True, available=True, standby=True, program=None)
+
+
+def test_append() -> None:
+    """Test samples are added to the buffer."""
+    buffer = StateBuffer(4)
+    assert len(buffer) == 0
+    assert buffer.latest().at.tolist() == []
+
+    buffer.append(ACTIVE, 1.0)
+    buffer.append(STANDBY, 2.0)
+
+    samples = buffer.latest()
+    assert len(buffer) == 2
+    assert samples.at.tolist() == [1.0, 2.0]
+    assert samples.standby.tolist() == [0, 1]
+    assert samples.major.tolist() == [231, 0]
+    assert samples.minor.tolist() == [65535, 0]
+    assert samples.program_id.tolist() == [4405732, 0]
+    assert samples.position.tolist() == [263, 0]
+
+
+def test_wrap() -> None:
+    """Test the oldest samples are overwritten once the buffer is full."""
+    buffer = StateBuffer(4)
+
+    for second in range(10):
+        buffer.append(STANDBY if second % 2 else ACTIVE, float(second))
+
+    assert len(buffer) == 4
+    assert buffer.latest().at.tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert buffer.latest(2).standby.tolist() == [0, 1]
+    assert buffer.latest(10).at.tolist() == [6.0, 7.0, 8.0, 9.0]
+
+
+def test_between() -> None:
+    """Test range queries return views of the samples."""
+    buffer = StateBuffer(4)
+
+    for second in range(6):
+        buffer.append(ACTIVE, float(second))
+
+    window = buffer.between(3.0, 4.5)
+    assert isinstance(window.at, memoryview)
+    assert window.at.tolist() == [3.0, 4.0]
+    assert buffer.between(0.0, 1.0).at.tolist() == []
+    assert buffer.between(5.0, 9.0).at.tolist() == [5.0]
+
+
+def test_history() -> None:
+    """Test states are recorded per client."""
+    history = StateHistory(capacity=8)
+    history.record("0", ACTIVE, 1.0)
+    history.record("0", STANDBY, 2.0)
+    history.record("2CA17D1CD30X", STANDBY)
+
+    assert len(history) == 2
+    assert "0" in history
+    assert list(history) == ["0", "2CA17D1CD30X"]
+    assert len(history["0"]) == 2
+    assert history["2CA17D1CD30X"].capacity == 8
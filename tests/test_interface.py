@@ -1,9 +1,13 @@
 """Tests for DIRECTV."""
+import asyncio
+import json
 from typing import List
 
 import pytest
 from aiohttp import ClientSession
 from directv import DIRECTV, DIRECTVError
+from directv.cache import ResponseCache
+from directv.history import StateHistory
 from directv.models import Info, Program, State
 
 from . import load_fixture
@@ -53,6 +57,63 @@ async def test_update(aresponses):
         assert response.info
 
 
+@pytest.mark.asyncio
+async def test_state_cached_inflight(aresponses):
+    """Test reads in flight during invalidation are not cached."""
+
+    async def response_handler(_):
+        await asyncio.sleep(0.1)
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-get-tuned.json"),
+        )
+
+    aresponses.add(MATCH_HOST, "/tv/getTuned", "GET", response_handler)
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session, cache=ResponseCache())
+        tuned = asyncio.ensure_future(dtv.tuned())
+        await asyncio.sleep(0.05)
+        dtv.cache.invalidate("0")
+
+        assert await tuned
+        assert not dtv.cache
+
+
+@pytest.mark.asyncio
+async def test_update_concurrent(aresponses):
+    """Test concurrent updates share a single set of requests."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-get-version.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getLocations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-get-locations.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        first, second = await asyncio.gather(dtv.update(), dtv.update())
+
+        assert first is second
+        assert dtv.device is first
+
+
 @pytest.mark.asyncio
 async def test_remote(aresponses):
     """Test remote is handled correctly."""
@@ -81,6 +142,82 @@ async def test_remote_invalid_key():
             await dtv.remote("super")
 
 
+@pytest.mark.asyncio
+async def test_remote_sequence(aresponses):
+    """Test remote key sequence is handled correctly."""
+    requests = []
+
+    def response_handler(request):
+        requests.append(dict(request.query))
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("remote-process-key.json"),
+        )
+
+    for _ in range(4):
+        aresponses.add(MATCH_HOST, "/remote/processKey", "GET", response_handler)
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        await dtv.remote_sequence(
+            ["menu", "down", ("select", "keyDown"), ("select", "keyUp")],
+            client="2CA17D1CD30X",
+            pacing=0.01,
+        )
+
+    assert [(request["key"], request["hold"]) for request in requests] == [
+        ("menu", "keyPress"),
+        ("down", "keyPress"),
+        ("select", "keyDown"),
+        ("select", "keyUp"),
+    ]
+    assert all(request["clientAddr"] == "2CA17D1CD30X" for request in requests)
+
+
+@pytest.mark.asyncio
+async def test_remote_sequence_invalid():
+    """Test remote key sequence is validated before sending keys."""
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        with pytest.raises(DIRECTVError):
+            await dtv.remote_sequence(["menu", "super"])
+
+        with pytest.raises(DIRECTVError):
+            await dtv.remote_sequence(["menu"], hold="keyHold")
+
+        with pytest.raises(DIRECTVError):
+            await dtv.remote_macro("super")
+
+
+@pytest.mark.asyncio
+async def test_remote_macro(aresponses):
+    """Test remote macro runs on every client."""
+    requests = []
+
+    def response_handler(request):
+        requests.append(dict(request.query))
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("remote-process-key.json"),
+        )
+
+    for _ in range(4):
+        aresponses.add(MATCH_HOST, "/remote/processKey", "GET", response_handler)
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        await dtv.remote_macro("wake", clients=["0", "2CA17D1CD30X"])
+
+    assert sorted((request["clientAddr"], request["key"]) for request in requests) == [
+        ("0", "exit"),
+        ("0", "poweron"),
+        ("2CA17D1CD30X", "exit"),
+        ("2CA17D1CD30X", "poweron"),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_state(aresponses):
     """Test active state is handled correctly."""
@@ -118,6 +255,81 @@ async def test_state(aresponses):
         assert isinstance(response.program, Program)
 
 
+@pytest.mark.asyncio
+async def test_state_history(aresponses):
+    """Test polled states are recorded in the state history."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/mode",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-mode.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/getTuned",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-get-tuned.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session, history=StateHistory())
+        await dtv.state()
+
+        samples = dtv.history[(HOST, "0")].latest()
+        assert samples.major.tolist() == [231]
+        assert samples.standby.tolist() == [0]
+        assert samples.position.tolist() == [263]
+
+
+@pytest.mark.asyncio
+async def test_state_cached(aresponses):
+    """Test cached state is invalidated by commands to the same client."""
+    for _ in range(2):
+        aresponses.add(
+            MATCH_HOST,
+            "/info/mode",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("info-mode-standby.json"),
+            ),
+        )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/remote/processKey",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("remote-process-key.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session, cache=ResponseCache())
+        await dtv.state()
+        await dtv.state()
+        assert len(dtv.cache) == 1
+
+        await dtv.remote("poweron")
+        assert not dtv.cache
+
+        response = await dtv.state()
+        assert response.available
+        assert response.standby
+
+
 @pytest.mark.asyncio
 async def test_state_error_mode(aresponses):
     """Test state with generic mode error is handled correctly."""
@@ -274,6 +486,161 @@ async def test_state_standby(aresponses):
         assert response.program is None
 
 
+@pytest.mark.asyncio
+async def test_state_speculative(aresponses):
+    """Test speculative active state is handled correctly."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/mode",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-mode.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/getTuned",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-get-tuned.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session, speculative_state=True)
+        response = await dtv.state()
+
+        assert response
+        assert isinstance(response, State)
+        assert response.available
+        assert not response.standby
+
+        assert isinstance(response.program, Program)
+
+
+@pytest.mark.asyncio
+async def test_state_speculative_restricted_tuned(aresponses):
+    """Test speculative state with restricted tuned is handled correctly."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/mode",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-mode.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/getTuned",
+        "GET",
+        aresponses.Response(
+            status=403,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-get-tuned-restricted.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session, speculative_state=True)
+        response = await dtv.state()
+
+        assert response.available
+        assert not response.standby
+        assert not response.authorized
+
+        assert response.program is None
+
+
+@pytest.mark.asyncio
+async def test_state_speculative_standby(aresponses):
+    """Test speculative standby state discards the tuned program."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/mode",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-mode-standby.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/getTuned",
+        "GET",
+        aresponses.Response(
+            status=500,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-get-tuned-error.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session, speculative_state=True)
+        response = await dtv.state()
+
+        assert response.available
+        assert response.standby
+
+        assert response.program is None
+
+
+@pytest.mark.asyncio
+async def test_states(aresponses):
+    """Test states of all client locations are handled correctly."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getVersion",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-get-version.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/info/getLocations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-get-locations.json"),
+        ),
+    )
+
+    for _ in range(2):
+        aresponses.add(
+            MATCH_HOST,
+            "/info/mode",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("info-mode-standby.json"),
+            ),
+        )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        response = await dtv.states()
+
+        assert response
+        assert list(response) == ["0", "2CA17D1CD30X"]
+        assert all(isinstance(state, State) for state in response.values())
+        assert all(state.standby for state in response.values())
+
+
 @pytest.mark.asyncio
 async def test_status(aresponses):
     """Test active state is handled correctly."""
@@ -377,6 +744,109 @@ async def test_tune(aresponses):
         await dtv.tune("231")
 
 
+@pytest.mark.asyncio
+async def test_tune_confirm(aresponses):
+    """Test confirmed tune is handled correctly."""
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/tune",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-tune.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/getTuned",
+        "GET",
+        aresponses.Response(
+            status=500,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-get-tuned-error.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/getTuned",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-get-tuned.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        response = await dtv.tune("231", confirm=True, confirm_interval=0.01)
+
+        assert response
+        assert isinstance(response.program, Program)
+        assert response.program.channel == "231"
+        assert response.elapsed > 0
+
+
+@pytest.mark.asyncio
+async def test_tune_confirm_timeout(aresponses):
+    """Test unconfirmed tune is handled correctly."""
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/tune",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-tune.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/getTuned",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-get-tuned.json"),
+        ),
+        repeat=100,
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        with pytest.raises(DIRECTVError):
+            await dtv.tune(
+                "232", confirm=True, confirm_timeout=0.2, confirm_interval=0.01
+            )
+
+
+@pytest.mark.asyncio
+async def test_tune_confirm_invalid(aresponses):
+    """Test invalid channel is rejected before tuning when confirming."""
+    requests = []
+
+    async def response_handler(request):
+        requests.append(request)
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-tune.json"),
+        )
+
+    aresponses.add(MATCH_HOST, "/tv/tune", "GET", response_handler)
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        with pytest.raises(DIRECTVError, match="Channel is invalid"):
+            await dtv.tune("HBO", confirm=True)
+
+    assert not requests
+
+
 @pytest.mark.asyncio
 async def test_tuned(aresponses):
     """Test tuned is handled correctly."""
@@ -397,3 +867,54 @@ async def test_tuned(aresponses):
 
         assert response
         assert isinstance(response, Program)
+
+
+@pytest.mark.asyncio
+async def test_tuned_concurrent(aresponses):
+    """Test concurrent tuned calls share a single request."""
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/getTuned",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-get-tuned.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        responses = await asyncio.gather(*(dtv.tuned() for _ in range(3)))
+
+        assert all(isinstance(response, Program) for response in responses)
+        assert responses[0] == responses[2]
+
+
+@pytest.mark.asyncio
+async def test_tuned_unchanged(aresponses):
+    """Test unchanged tuned program is reused between polls."""
+    tuned = json.loads(load_fixture("tv-get-tuned.json"))
+
+    for offset in (263, 263, 264):
+        aresponses.add(
+            MATCH_HOST,
+            "/tv/getTuned",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=json.dumps(dict(tuned, offset=offset)),
+            ),
+        )
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(HOST, session=session)
+        first = await dtv.tuned()
+        second = await dtv.tuned()
+        third = await dtv.tuned()
+
+        assert second is first
+        assert third is not first
+        assert third.position == 264
+        assert third.start_time is first.start_time
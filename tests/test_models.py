@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 
 import directv.models as models
 import pytest
-from directv import DIRECTVError
+from directv import DIRECTVAccessRestricted, DIRECTVConnectionError, DIRECTVError
 
 INFO = {
     "accessCardId": "0021-1495-6572",
@@ -224,3 +224,72 @@ def test_state() -> None:
 
     assert state
     assert isinstance(state.at, datetime)
+
+
+def test_bulk_tune() -> None:
+    """Test the BulkTune model."""
+    bulk = models.BulkTune(
+        channel="231",
+        latencies={"1.2.3.4": 0.25, "1.2.3.5": 0.5, "1.2.3.6": 0.75},
+        errors={"1.2.3.7": DIRECTVError("HTTP 500")},
+    )
+
+    assert bulk.max_latency == 0.75
+    assert bulk.mean_latency == 0.5
+    assert bulk.skew == 0.5
+
+    empty = models.BulkTune(channel="231", latencies={}, errors={})
+
+    assert empty.max_latency is None
+    assert empty.mean_latency is None
+    assert empty.skew is None
+
+
+def test_request_result() -> None:
+    """Test the RequestResult model."""
+    result = models.RequestResult(200, {"mode": 0})
+
+    assert result.ok
+    assert result.reachable
+    assert not result.restricted
+    assert result.unwrap() == {"mode": 0}
+
+    result = models.RequestResult(500, error={"status": {}}, message="HTTP 500")
+
+    assert not result.ok
+    assert result.reachable
+    with pytest.raises(DIRECTVError) as excinfo:
+        result.unwrap()
+    assert excinfo.value.args == ("HTTP 500", {"status": {}})
+
+    result = models.RequestResult(403, error={}, message="Access restricted.")
+
+    assert result.restricted
+    with pytest.raises(DIRECTVAccessRestricted):
+        result.unwrap()
+
+    result = models.RequestResult(None, error={}, message="Timeout occurred")
+
+    assert not result.reachable
+    with pytest.raises(DIRECTVConnectionError):
+        result.unwrap()
+
+
+def test_program_fingerprint() -> None:
+    """Test the fingerprint of a program ignores its position."""
+    moved = dict(PROGRAM, offset=300)
+
+    assert models.Program.fingerprint(PROGRAM) == models.Program.fingerprint(moved)
+    assert models.Program.fingerprint(PROGRAM) != models.Program.fingerprint(
+        PROGRAM_MOVIE
+    )
+
+
+def test_program_with_position() -> None:
+    """Test copying a program to another position."""
+    program = models.Program.from_dict(PROGRAM)
+    moved = program.with_position(300)
+
+    assert moved.position == 300
+    assert program.position == 263
+    assert moved == models.Program.from_dict(dict(PROGRAM, offset=300))
@@ -0,0 +1,140 @@
+"""Tests for DirecTV Program Pool."""
+import gc
+import json
+
+import pytest
+from aiohttp import ClientSession
+from directv import DIRECTV
+from directv.models import Program
+from directv.pool import ProgramPool
+
+from . import load_fixture
+
+PROGRAM = json.loads(load_fixture("tv-get-tuned.json"))
+
+HOSTS = ["1.2.3.4", "1.2.3.5"]
+PORT = 8080
+
+
+def test_shared_program() -> None:
+    """Test clients watching the same airing share one program."""
+    pool = ProgramPool()
+
+    first = Program.from_dict(dict(PROGRAM), pool)
+    second = Program.from_dict(dict(PROGRAM), pool)
+
+    assert first is second
+    assert first == Program.from_dict(PROGRAM)
+    assert pool.stats == {
+        "hits": 1,
+        "misses": 1,
+        "size": 1,
+        "programs": 1,
+        "hit_rate": 0.5,
+    }
+
+
+def test_interned_strings() -> None:
+    """Test programs at other positions share the values of their airing."""
+    pool = ProgramPool()
+
+    first = pool.from_dict({**PROGRAM, "offset": 1})
+    second = pool.from_dict({**PROGRAM, "offset": 2})
+
+    assert first is not second
+    assert second.position == 2
+    assert first.title is second.title
+    assert first.channel is second.channel
+    assert pool.hits == 0
+    assert len(pool) == 1
+
+
+def test_with_position() -> None:
+    """Test moving a program shares copies at the same position."""
+    pool = ProgramPool()
+
+    first = pool.from_dict(PROGRAM)
+    second = pool.from_dict(PROGRAM)
+
+    assert pool.with_position(first, 300) is pool.with_position(second, 300)
+    assert pool.with_position(first, 300).position == 300
+    assert pool.stats["hits"] == 2
+
+
+def test_changed_program() -> None:
+    """Test a changed airing replaces the pooled program."""
+    pool = ProgramPool()
+
+    first = pool.from_dict(PROGRAM)
+    second = pool.from_dict({**PROGRAM, "isRecording": True})
+
+    assert first is not second
+    assert second.recording
+    assert pool.stats["misses"] == 2
+    assert pool.from_dict({**PROGRAM, "isRecording": True}) is second
+
+
+def test_airings() -> None:
+    """Test airings stay pooled while programs at a position are weak."""
+    pool = ProgramPool(max_size=1)
+
+    program = pool.from_dict(PROGRAM)
+    del program
+    gc.collect()
+
+    assert len(pool) == 1
+    assert pool.stats["programs"] == 0
+    assert pool.from_dict(PROGRAM).title is pool.from_dict(PROGRAM).title
+
+    pool.from_dict({**PROGRAM, "programId": "1"})
+    assert len(pool) == 1
+
+    pool.reset()
+    assert pool.stats["hit_rate"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_state_polls(aresponses):
+    """Test receivers polled at advancing positions keep sharing programs."""
+    for offset in range(263, 268):
+        for host in HOSTS:
+            aresponses.add(
+                f"{host}:{PORT}",
+                "/info/mode",
+                "GET",
+                aresponses.Response(
+                    status=200,
+                    headers={"Content-Type": "application/json"},
+                    text=load_fixture("info-mode.json"),
+                ),
+            )
+
+            aresponses.add(
+                f"{host}:{PORT}",
+                "/tv/getTuned",
+                "GET",
+                aresponses.Response(
+                    status=200,
+                    headers={"Content-Type": "application/json"},
+                    text=json.dumps({**PROGRAM, "offset": offset}),
+                ),
+            )
+
+    pool = ProgramPool()
+
+    async with ClientSession() as session:
+        receivers = [
+            DIRECTV(host, session=session, program_pool=pool) for host in HOSTS
+        ]
+
+        for offset in range(263, 268):
+            first, second = [
+                (await receiver.state()).program for receiver in receivers
+            ]
+
+            assert first is second
+            assert first.position == offset
+
+    assert pool.stats["hits"] == 5
+    assert pool.stats["misses"] == 5
+    assert len(pool) == 1
@@ -0,0 +1,104 @@
+"""Tests for DirecTV Request Queue."""
+import asyncio
+
+import pytest
+from aiohttp import ClientSession
+from directv import DIRECTV, DIRECTVError
+from directv.const import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+from directv.queue import RequestQueue, is_conflict
+
+from . import load_fixture
+
+HOST = "1.2.3.4"
+PORT = 8080
+
+MATCH_HOST = f"{HOST}:{PORT}"
+
+
+def test_is_conflict() -> None:
+    """Test conflicting requests are recognized."""
+    conflict = {"status": {"code": 500, "msg": "Request conflict."}}
+
+    assert is_conflict(conflict)
+    assert not is_conflict({"status": {"msg": "Failed"}})
+    assert not is_conflict({})
+    assert not is_conflict(None)
+
+
+@pytest.mark.asyncio
+async def test_priority() -> None:
+    """Test interactive requests jump ahead of background requests."""
+    queue = RequestQueue(concurrency=1)
+    order = []
+
+    async def request(name: str, priority: int) -> None:
+        await queue.acquire(priority)
+        order.append(name)
+        queue.release()
+
+    await queue.acquire()
+    tasks = [
+        asyncio.ensure_future(request("poll", PRIORITY_BACKGROUND)),
+        asyncio.ensure_future(request("tune", PRIORITY_INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    assert queue.pending == 2
+
+    queue.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["tune", "poll"]
+    assert queue.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_tune_conflict_retry(aresponses):
+    """Test conflicting tune requests are retried."""
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/tune",
+        "GET",
+        aresponses.Response(
+            status=500,
+            headers={"Content-Type": "application/json"},
+            body=load_fixture("tv-tune-conflict.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/tune",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-tune.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        queue = RequestQueue(backoff=0)
+        dtv = DIRECTV(HOST, session=session, request_queue=queue)
+        await dtv.tune("231")
+
+
+@pytest.mark.asyncio
+async def test_tune_conflict_retries_exhausted(aresponses):
+    """Test conflicting tune requests fail once retries are exhausted."""
+    for _ in range(2):
+        aresponses.add(
+            MATCH_HOST,
+            "/tv/tune",
+            "GET",
+            aresponses.Response(
+                status=500,
+                headers={"Content-Type": "application/json"},
+                body=load_fixture("tv-tune-conflict.json"),
+            ),
+        )
+
+    async with ClientSession() as session:
+        queue = RequestQueue(retries=1, backoff=0)
+        dtv = DIRECTV(HOST, session=session, request_queue=queue)
+        with pytest.raises(DIRECTVError):
+            await dtv.tune("231")
@@ -0,0 +1,67 @@
+"""Tests for DirecTV Polling Schedules."""
+from dataclasses import replace
+
+from directv.models import Program, State
+from directv.scheduler import (
+    PollScheduler,
+    PollTier,
+    ProgramBoundaryScheduler,
+    TieredScheduler,
+)
+
+from .test_models import PROGRAM
+
+TUNED = Program.from_dict(PROGRAM)
+
+
+def _state(position: int) -> State:
+    """Return an active state at the given position of the program."""
+    program = replace(TUNED, position=position)
+    return State(authorized=True, available=True, standby=False, program=program)
+
+
+def test_poll_scheduler() -> None:
+    """Test the fixed polling schedule."""
+    scheduler = PollScheduler(10)
+
+    assert scheduler.next_interval(None) == 10
+    assert scheduler.next_interval(_state(0)) == 10
+
+
+def test_program_boundary_scheduler() -> None:
+    """Test polling follows the end of the tuned program."""
+    scheduler = ProgramBoundaryScheduler(
+        interval=5, min_interval=1, max_interval=30, window=15
+    )
+    standby = State(authorized=True, available=True, standby=True, program=None)
+
+    assert scheduler.next_interval(None) == 5
+    assert scheduler.next_interval(standby) == 5
+    assert scheduler.next_interval(_state(0)) == 30
+    assert scheduler.next_interval(_state(TUNED.duration - 25)) == 10
+    assert scheduler.next_interval(_state(TUNED.duration - 10)) == 1
+    assert scheduler.next_interval(_state(TUNED.duration + 10)) == 1
+    assert scheduler.next_interval(_state(TUNED.duration + 60)) == 5
+    assert scheduler.next_interval(_state(5000)) == 5
+
+
+def test_tiered_scheduler() -> None:
+    """Test polling backs off per activity tier."""
+    scheduler = TieredScheduler(
+        active=PollScheduler(5),
+        standby=PollTier(interval=30, max_interval=100),
+        dead=PollTier(interval=60, max_interval=3600, backoff=3),
+    )
+    standby = State(authorized=True, available=True, standby=True, program=None)
+    dead = State(authorized=True, available=False, standby=True, program=None)
+    restricted = State(authorized=False, available=False, standby=True, program=None)
+
+    assert scheduler.tier(_state(0)) == "active"
+    assert scheduler.tier(standby) == "standby"
+    assert scheduler.tier(dead) == "dead"
+    assert scheduler.tier(restricted) == "dead"
+
+    assert [scheduler.next_interval(standby) for _ in range(4)] == [30, 60, 100, 100]
+    assert scheduler.next_interval(_state(0)) == 5
+    assert scheduler.next_interval(standby) == 30
+    assert [scheduler.next_interval(dead) for _ in range(3)] == [60, 180, 540]
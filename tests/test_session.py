@@ -0,0 +1,89 @@
+"""Tests for DirecTV Session Manager."""
+import pytest
+from directv import DIRECTV
+from directv.session import SessionManager
+
+from . import load_fixture
+
+HOST = "1.2.3.4"
+PORT = 8080
+
+MATCH_HOST = f"{HOST}:{PORT}"
+
+
+@pytest.mark.asyncio
+async def test_acquire_release() -> None:
+    """Test sessions are shared and closed by the last release."""
+    manager = SessionManager(limit=10, limit_per_host=1)
+    first = manager.acquire()
+    second = manager.acquire()
+
+    assert first is second
+    assert first.connector.limit == 10
+    assert first.connector.limit_per_host == 1
+
+    await manager.release(first)
+    assert not first.closed
+
+    await manager.release(second)
+    assert first.closed
+
+    third = manager.acquire()
+    assert third is not first
+    await manager.release(third)
+
+
+@pytest.mark.asyncio
+async def test_shared_session(aresponses):
+    """Test receivers without a session share a connection pool."""
+    for _ in range(2):
+        aresponses.add(
+            MATCH_HOST,
+            "/info/mode",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("info-mode.json"),
+            ),
+        )
+
+    manager = SessionManager()
+    first = DIRECTV(HOST, session_manager=manager)
+    second = DIRECTV(HOST, session_manager=manager)
+
+    assert await first.status() == "active"
+    assert await second.status() == "active"
+
+    session = first._session
+    assert session is second._session
+
+    await first.close()
+    assert not session.closed
+
+    await second.close()
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_default_limit_per_host() -> None:
+    """Test the connections per host are unlimited by default."""
+    manager = SessionManager()
+    session = manager.acquire()
+
+    assert session.connector.limit_per_host == 0
+
+    await manager.release(session)
+
+
+@pytest.mark.asyncio
+async def test_keepalive_timeout() -> None:
+    """Test the keep-alive timeout of shared sessions is reported."""
+    manager = SessionManager(keepalive_timeout=30)
+    session = manager.acquire()
+    manager.configure(keepalive_timeout=5)
+
+    assert manager.keepalive_timeout(session) == 30
+
+    await manager.release(session)
+    assert manager.keepalive_timeout(session) == 0
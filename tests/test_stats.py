@@ -0,0 +1,96 @@
+"""Tests for DirecTV Request Statistics."""
+import asyncio
+
+import pytest
+from aiohttp import ClientSession
+from directv import DIRECTV
+from directv.stats import LatencyStats, RequestMetrics, StatsCollector
+
+from . import load_fixture
+
+HOST = "1.2.3.4"
+PORT = 8080
+
+MATCH_HOST = f"{HOST}:{PORT}"
+
+
+def test_latency_stats() -> None:
+    """Test running latency statistics."""
+    stats = LatencyStats()
+    assert stats.as_dict() == {"count": 0, "mean": 0.0, "max": 0.0}
+
+    stats.record(0.5)
+    stats.record(1.5)
+    assert stats.as_dict() == {"count": 2, "mean": 1.0, "max": 1.5}
+
+
+def test_stats_collector() -> None:
+    """Test statistics are collected per host and endpoint."""
+    collector = StatsCollector()
+    collector(RequestMetrics(HOST, "info/mode", 200, 0.07, 120, None, False))
+    collector(RequestMetrics(HOST, "info/mode", 403, 0.02, 0, None, True))
+    collector(RequestMetrics(HOST, "tv/tune", None, 12.0, 0, "timeout", True))
+
+    snapshot = collector.snapshot()
+    mode = snapshot[HOST]["info/mode"]
+    tune = snapshot[HOST]["tv/tune"]
+
+    assert mode["requests"] == 2
+    assert mode["bytes"] == 120
+    assert mode["statuses"] == {"2xx": 1, "403": 1}
+    assert mode["histogram"]["0.05"] == 1
+    assert mode["histogram"]["0.1"] == 1
+    assert tune["timeouts"] == 1
+    assert tune["histogram"]["inf"] == 1
+
+    collector.reset()
+    assert collector.snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_instrumentation(aresponses):
+    """Test requests are reported to the instrumentation hook."""
+    aresponses.add(
+        MATCH_HOST,
+        "/info/mode",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("info-mode.json"),
+        ),
+    )
+
+    aresponses.add(
+        MATCH_HOST,
+        "/tv/getTuned",
+        "GET",
+        aresponses.Response(
+            status=500,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("tv-get-tuned-error.json"),
+        ),
+    )
+
+    async def response_handler(_):
+        await asyncio.sleep(2)
+        return aresponses.Response(body="Timeout!")
+
+    aresponses.add(MATCH_HOST, "/info/mode", "GET", response_handler)
+
+    collector = StatsCollector()
+
+    async with ClientSession() as session:
+        dtv = DIRECTV(
+            HOST, session=session, request_timeout=0.1, instrumentation=collector
+        )
+        await dtv.state()
+        await dtv.status("1")
+
+    snapshot = collector.snapshot()[HOST]
+
+    assert snapshot["info/mode"]["requests"] == 2
+    assert snapshot["info/mode"]["bytes"] > 0
+    assert snapshot["info/mode"]["statuses"] == {"2xx": 1}
+    assert snapshot["info/mode"]["timeouts"] == 1
+    assert snapshot["tv/getTuned"]["statuses"] == {"5xx": 1}
@@ -0,0 +1,55 @@
+"""Tests for DirecTV Program Table."""
+import json
+
+from directv.models import Program
+from directv.table import FLAG_RECORDED, FLAG_VIEWED, ProgramTable
+
+from . import load_fixture
+
+PROGRAM = json.loads(load_fixture("tv-get-tuned.json"))
+
+PROGRAM_MUSIC = {
+    "callsign": "MCSTH",
+    "duration": 10800,
+    "isPpv": False,
+    "major": 851,
+    "minor": 65535,
+    "music": {"by": "Artist", "cd": "Album", "title": "Song"},
+    "offset": 2,
+    "title": "Music Channel",
+}
+
+PROGRAM_SUBCHANNEL = {
+    "callsign": "KTVUDT",
+    "major": 2,
+    "minor": 1,
+    "offset": 0,
+    "title": "News",
+}
+
+
+def test_from_dicts() -> None:
+    """Test rows of the table match their Program objects."""
+    payloads = [PROGRAM, PROGRAM_MUSIC, PROGRAM_SUBCHANNEL]
+    table = ProgramTable.from_dicts(payloads)
+
+    assert len(table) == 3
+    for index, data in enumerate(payloads):
+        assert table.program(index) == Program.from_dict(data)
+
+    assert table.channel(2) == "2-1"
+    assert table.strings["music_artist"][1] == "Artist"
+
+
+def test_queries() -> None:
+    """Test filtering and aggregating the table."""
+    table = ProgramTable.from_dicts(
+        [PROGRAM, PROGRAM, PROGRAM_MUSIC, PROGRAM_SUBCHANNEL]
+    )
+
+    assert table.where_channel("231") == [0, 1]
+    assert table.where_channel("2-1") == [3]
+    assert table.where_channel("206") == []
+    assert table.where_flag(FLAG_RECORDED | FLAG_VIEWED) == [0, 1]
+    assert table.channel_counts() == {"231": 2, "851": 1, "2-1": 1}
+    assert table.strings["title"][0] is table.strings["title"][1]
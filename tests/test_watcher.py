@@ -0,0 +1,129 @@
+"""Tests for DirecTV State Watcher."""
+import asyncio
+
+import pytest
+from directv import DIRECTV
+from directv.models import Program, State
+from directv.scheduler import PollScheduler
+from directv.watcher import STATE_CHANGES, StateWatcher, state_changes
+
+from .test_models import PROGRAM, PROGRAM_MOVIE
+
+HOST = "1.2.3.4"
+
+ACTIVE = State(
+    authorized=True,
+    available=True,
+    standby=False,
+    program=Program.from_dict(PROGRAM),
+)
+
+MOVIE = State(
+    authorized=True,
+    available=True,
+    standby=False,
+    program=Program.from_dict(PROGRAM_MOVIE),
+)
+
+STANDBY = State(authorized=True, available=True, standby=True, program=None)
+
+
+def _states(dtv: DIRECTV, *states: State) -> None:
+    """Make the receiver return the given states in order."""
+    pending = list(states)
+
+    async def state(client: str = "0") -> State:
+        return pending.pop(0) if len(pending) > 1 else pending[0]
+
+    dtv.state = state  # type: ignore
+
+
+def test_state_changes() -> None:
+    """Test changes between states are detected."""
+    assert state_changes(None, ACTIVE) == STATE_CHANGES
+    assert state_changes(ACTIVE, ACTIVE) == ()
+    assert state_changes(ACTIVE, STANDBY) == ("standby", "channel", "program")
+    assert state_changes(ACTIVE, MOVIE) == ("channel", "program")
+
+
+@pytest.mark.asyncio
+async def test_poll() -> None:
+    """Test polling only emits changes."""
+    dtv = DIRECTV(HOST)
+    _states(dtv, ACTIVE, STANDBY)
+    events = []
+
+    watcher = StateWatcher(dtv, interval=3600)
+    unsubscribe = watcher.subscribe(events.append)
+    await watcher.poll()
+    await watcher.poll()
+    unsubscribe()
+
+    assert not watcher.running
+    assert [event.changes for event in events] == [
+        STATE_CHANGES,
+        ("standby", "channel", "program"),
+    ]
+    assert events[1].previous is ACTIVE
+    assert events[1].current is STANDBY
+
+
+@pytest.mark.asyncio
+async def test_watch() -> None:
+    """Test watching fans out changes to every listener."""
+    dtv = DIRECTV(HOST)
+    _states(dtv, ACTIVE, ACTIVE, MOVIE)
+    callbacks = []
+
+    unsubscribe = dtv.watcher(interval=0).subscribe(callbacks.append)
+
+    events = []
+    async for event in dtv.watch():
+        events.append(event)
+        if event.current is MOVIE:
+            break
+
+    unsubscribe()
+    await dtv.close()
+
+    assert dtv.watcher() is dtv.watcher()
+    assert events[-1].current is MOVIE
+    assert [event.current for event in callbacks] == [ACTIVE, MOVIE]
+
+
+@pytest.mark.asyncio
+async def test_watch_close() -> None:
+    """Test event streams end when the receiver is closed."""
+    dtv = DIRECTV(HOST)
+    _states(dtv, ACTIVE)
+    events = []
+
+    async def consume() -> None:
+        async for event in dtv.watch(interval=3600):
+            events.append(event)
+
+    consumer = asyncio.ensure_future(consume())
+    await asyncio.sleep(0.05)
+    await dtv.close()
+
+    await asyncio.wait_for(consumer, 1)
+    assert [event.current for event in events] == [ACTIVE]
+    assert not dtv.watcher().running
+
+
+@pytest.mark.asyncio
+async def test_watcher_schedule() -> None:
+    """Test later schedules replace the schedule of the shared watcher."""
+    dtv = DIRECTV(HOST)
+    watcher = dtv.watcher(interval=5)
+
+    assert dtv.watcher() is watcher
+    assert watcher.scheduler.next_interval(None) == 5
+
+    dtv.watch(interval=1)
+    assert dtv.watcher().scheduler.next_interval(None) == 1
+
+    scheduler = PollScheduler(30)
+    assert dtv.watcher(scheduler=scheduler).scheduler is scheduler
+
+    await dtv.close()